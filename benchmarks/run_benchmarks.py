@@ -0,0 +1,236 @@
+"""
+Benchmark suite for finite_topology.
+
+Times the core methods of the library on every constructor of ``known_topologies``, over a range of space
+sizes, and records the wall time and the peak memory allocated by each call. Every case runs in its own
+subprocess with a time budget, and cases that exceed it are reported as "did not finish" instead of blocking
+the run. Results can be saved as a baseline and compared against it later.
+
+Usage::
+
+    python benchmarks/run_benchmarks.py                            # all cases, default sizes
+    python benchmarks/run_benchmarks.py --sizes 4 8 16 --budget 2  # custom sizes and time budget (seconds)
+    python benchmarks/run_benchmarks.py --families discrete --methods is_connected get_closure
+    python benchmarks/run_benchmarks.py --save baseline.json       # record a baseline
+    python benchmarks/run_benchmarks.py --compare baseline.json    # report changes against it
+
+The time budget covers the whole subprocess, including building the inputs, and once a case does not finish
+its larger sizes are reported as not finished without running them. Each measured call starts from freshly
+built topologies, so cached results (minimal neighborhoods, property profile, certificates) are never reused
+between repetitions; building the inputs is not timed.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SIZES = [2, 4, 6, 8, 12, 16, 24, 32]
+
+# Time differences below this many seconds are timer noise and never count as a regression
+NOISE = 1e-4
+
+
+# Families: name -> function building the topology on n points, or returning None when the family has no
+# member of size n
+def _families():
+    from finite_topology import known_topologies as known
+
+    return {
+        "discrete": lambda n: known.create_discrete_topology(set(range(n))),
+        "trivial": lambda n: known.create_trivial_topology(set(range(n))),
+        "sierpinski": lambda n: known.create_sierpinski_topology() if n == 2 else None,
+        "particular_point": lambda n: known.create_particular_point_topology(set(range(n)), 0) if n else None,
+        "excluded_point": lambda n: known.create_excluded_point_topology(set(range(n)), 0) if n else None,
+        "divisibility": lambda n: known.create_divisibility_topology(set(range(1, n + 1))),
+        "equivalence": lambda n: known.create_topology_from_equivalence(set(range(n)),
+                                                                        lambda x, y: x % 3 == y % 3),
+        "upward_closed": lambda n: known.create_upward_closed_topology(
+            set(range(n)), {x: set(range(x, n)) for x in range(n)}),
+        "alexandrov": lambda n: known.create_alexandrov_topology(set(range(1, n + 1)),
+                                                                 lambda x, y: y % x == 0),
+    }
+
+
+# Methods: name -> (setup, call). The setup receives a function building a fresh topology and returns the
+# arguments of the measured call.
+def _first_point(topology):
+    return {min(topology.space)} if topology.space else set()
+
+
+def _identity(topology):
+    from finite_topology.functions import Function
+
+    return Function(topology, topology, {x: x for x in topology.space})
+
+
+METHODS = {
+    "is_topology": (lambda build: (build(),), lambda t: t.is_topology()),
+    "is_connected": (lambda build: (build(),), lambda t: t.is_connected()),
+    "is_hausdorff": (lambda build: (build(),), lambda t: t.is_hausdorff()),
+    "get_closure": (lambda build: (lambda t: (t, _first_point(t)))(build()),
+                    lambda t, subset: t.get_closure(subset)),
+    "get_basis": (lambda build: (build(),), lambda t: t.get_basis()),
+    "find_dense_subset": (lambda build: (build(),), lambda t: t.find_dense_subset()),
+    "is_structurally_equal": (lambda build: (build(), build()),
+                              lambda t, other: t.is_structurally_equal(other)),
+    "Function.is_continuous": (lambda build: (_identity(build()),), lambda f: f.is_continuous()),
+}
+
+
+def run_case(family: str, method: str, n: int, repeat: int) -> dict:
+    """
+    Measures one case in the current process: the best wall time over ``repeat`` calls and the peak memory of
+    one more call traced with tracemalloc.
+    """
+    build = _families()[family]
+    if build(n) is None:
+        return {"status": "skipped"}
+    setup, call = METHODS[method]
+    times = []
+    for _ in range(repeat):
+        arguments = setup(lambda: build(n))
+        start = time.perf_counter()
+        call(*arguments)
+        times.append(time.perf_counter() - start)
+
+    arguments = setup(lambda: build(n))
+    tracemalloc.start()
+    try:
+        call(*arguments)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"status": "ok", "time": min(times), "peak_memory": peak}
+
+
+def run_case_in_subprocess(family: str, method: str, n: int, repeat: int, budget: float, path: str) -> dict:
+    """
+    Runs a case in a child interpreter, killing it when it exceeds the time budget.
+    """
+    command = [sys.executable, os.path.abspath(__file__), "--path", path, "--case", family, method, str(n),
+               "--repeat", str(repeat)]
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=budget)
+    except subprocess.TimeoutExpired:
+        return {"status": "did not finish"}
+    if completed.returncode != 0:
+        lines = completed.stderr.strip().splitlines()
+        return {"status": "error", "error": lines[-1] if lines else f"exit code {completed.returncode}"}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _format_time(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+
+def _format_memory(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def _describe(result: dict) -> str:
+    if result["status"] == "ok":
+        return f"{_format_time(result['time']):>10}  {_format_memory(result['peak_memory']):>9}"
+    if result["status"] == "error":
+        return "error: " + result["error"]
+    return result["status"]
+
+
+def _compare(result: dict, reference: dict, threshold: float) -> str:
+    """
+    Describes a result relative to its baseline, flagging changes beyond the threshold ratio.
+    """
+    if reference is None:
+        return "new"
+    if result["status"] != "ok" or reference["status"] != "ok":
+        if result["status"] == reference["status"]:
+            return ""
+        return f"{reference['status']} -> {result['status']}"
+    ratio = result["time"] / reference["time"] if reference["time"] else float("inf")
+    if abs(result["time"] - reference["time"]) < NOISE:
+        return f"{ratio:.2f}x"
+    if ratio > threshold:
+        return f"{ratio:.2f}x slower"
+    if ratio < 1 / threshold:
+        return f"{1 / ratio:.2f}x faster"
+    return f"{ratio:.2f}x"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="numbers of points")
+    parser.add_argument("--families", nargs="+", help="known topology families to run (default: all)")
+    parser.add_argument("--methods", nargs="+", help="methods to run (default: all)")
+    parser.add_argument("--budget", type=float, default=5.0, help="time budget per case, in seconds")
+    parser.add_argument("--repeat", type=int, default=3, help="timed calls per case, the best one is kept")
+    parser.add_argument("--save", metavar="FILE", help="write the results to a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="compare the results with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=1.5,
+                        help="time ratio reported as a regression or an improvement when comparing")
+    parser.add_argument("--path", default=REPOSITORY, help="directory containing the finite_topology package")
+    parser.add_argument("--case", nargs=3, metavar=("FAMILY", "METHOD", "N"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, args.path)
+    if args.case:
+        family, method, n = args.case
+        print(json.dumps(run_case(family, method, int(n), args.repeat)))
+        return 0
+
+    families = args.families or list(_families())
+    methods = args.methods or list(METHODS)
+    unknown = ([name for name in families if name not in _families()]
+               + [name for name in methods if name not in METHODS])
+    if unknown:
+        parser.error(f"unknown families or methods: {', '.join(unknown)}")
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+
+    results = {}
+    regressions = 0
+    for family in families:
+        for method in methods:
+            exhausted = False
+            for n in args.sizes:
+                key = f"{family}/{method}/{n}"
+                if exhausted:
+                    # Larger sizes of a case that did not finish are not attempted
+                    result = {"status": "did not finish"}
+                else:
+                    result = run_case_in_subprocess(family, method, n, args.repeat, args.budget, args.path)
+                    exhausted = result["status"] == "did not finish"
+                if result["status"] == "skipped":
+                    continue
+                results[key] = result
+                line = f"{key:<50} {_describe(result)}"
+                if args.compare:
+                    comparison = _compare(result, baseline.get(key), args.threshold)
+                    regressions += comparison.endswith("slower") or comparison.startswith("ok ->")
+                    line = f"{line:<75} {comparison}"
+                print(line, flush=True)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"python": sys.version.split()[0], "budget": args.budget, "results": results}, file,
+                      indent=1)
+    if args.compare:
+        print(f"{regressions} regressions against {args.compare}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
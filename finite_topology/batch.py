@@ -0,0 +1,145 @@
+"""
+Classification of large batches of topologies across a pool of processes.
+
+:func:`classify_topologies` computes, for every topology of an iterable, its property profile (see
+:meth:`Topology.properties`), its homeomorphism certificate (see :meth:`Topology.get_certificate`) and the
+names of the homeomorphic entries of a catalogue of known topologies (see :meth:`Topology.identify_topology`).
+
+Topologies are sent to the workers in the compact encoding of :meth:`Topology.to_bytes`, without labels, and
+the catalogue is encoded the same way and indexed once per worker. The input is consumed in chunks, with a
+bounded number of chunks in flight, and the results are yielded in input order, so arbitrarily long streams
+(e.g. the records of a :class:`~finite_topology.catalogue.TopologyCatalogue`, read with ``get_bytes``) are
+classified in constant memory.
+
+On platforms that start workers with ``spawn`` (Windows, macOS) the calling script must be guarded with
+``if __name__ == '__main__':``.
+"""
+import os
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+from typing import Iterable, Iterator, NamedTuple, Optional, Union
+
+from .topology import Topology, TopologyProperties, TopologyRegistry, _iter_bits
+
+
+class Classification(NamedTuple):
+    """
+    Result of classifying a topology.
+
+    Attributes:
+    - properties (TopologyProperties): The property profile of the topology.
+    - certificate (tuple): The homeomorphism certificate.
+    - matches (list): Names of the known topologies homeomorphic to it.
+    """
+    properties: TopologyProperties
+    certificate: tuple
+    matches: list
+
+
+def _encode(topology: Union[Topology, bytes]):
+    """
+    Returns the payload sent to the workers: the encoding of a topology, or the number of points and the open
+    masks of a collection that is not a topology.
+    """
+    if not isinstance(topology, Topology):
+        return bytes(topology)
+    if topology.properties().is_topology:
+        return topology.to_bytes(labels=False)
+    return len(topology.points), tuple(topology._sorted_open_masks())
+
+
+def _decode(payload) -> Topology:
+    """
+    Rebuilds a topology on ``0..n-1`` from a payload made by :func:`_encode`.
+    """
+    if isinstance(payload, bytes):
+        return Topology.from_bytes(payload)
+    n, open_masks = payload
+    return Topology(range(n), [list(_iter_bits(mask)) for mask in open_masks])
+
+
+def _classify(topology: Topology, registry: TopologyRegistry) -> Classification:
+    return Classification(topology.properties(), topology.get_certificate(), registry.identify(topology))
+
+
+# Catalogue of known topologies of a worker process, set by the pool initializer
+_worker_registry = None
+
+
+def _initialize_worker(known_payloads: dict):
+    global _worker_registry
+    _worker_registry = TopologyRegistry({name: _decode(payload) for name, payload in known_payloads.items()})
+
+
+def _classify_chunk(payloads: list) -> list:
+    return [_classify(_decode(payload), _worker_registry) for payload in payloads]
+
+
+def _classify_serially(topologies: Iterator, registry: TopologyRegistry) -> Iterator[Classification]:
+    for topology in topologies:
+        if not isinstance(topology, Topology):
+            topology = Topology.from_bytes(topology)
+        yield _classify(topology, registry)
+
+
+def _classify_in_pool(topologies: Iterator, known_payloads: dict, processes: int,
+                      chunksize: int) -> Iterator[Classification]:
+    with Pool(processes, _initialize_worker, (known_payloads,)) as pool:
+        # At most two chunks per worker are waiting or running, so memory stays bounded
+        pending = deque()
+        while True:
+            while len(pending) < 2 * processes:
+                chunk = [_encode(topology) for topology in islice(topologies, chunksize)]
+                if not chunk:
+                    break
+                pending.append(pool.apply_async(_classify_chunk, (chunk,)))
+            if not pending:
+                return
+            yield from pending.popleft().get()
+
+
+def classify_topologies(topologies: Iterable[Union[Topology, bytes]], known_topologies=None,
+                        processes: Optional[int] = None, chunksize: int = 256) -> Iterator[Classification]:
+    """
+    Classifies a stream of topologies in parallel, yielding the results in input order.
+
+    The arguments are checked when the function is called. The topologies are only read, and the pool only
+    started, as the results are consumed.
+
+    Example:
+        >>> from finite_topology.enumeration import generate_topologies
+        >>> results = classify_topologies(generate_topologies(3), processes=1)
+        >>> sum(result.properties.T0 for result in results)
+        19
+
+    Parameters:
+        topologies (iterable): Topologies, or their encodings as returned by :meth:`Topology.to_bytes`.
+        known_topologies (dict or TopologyRegistry, optional): Named topologies to match against. Defaults to
+            the class registry ``Topology.known_topologies``.
+        processes (int, optional): Number of worker processes, by default the number of CPUs. With 1 the
+            topologies are classified in the calling process.
+        chunksize (int): Number of topologies sent to a worker at a time.
+
+    Returns:
+        Iterator[Classification]: One classification per input topology, in the same order.
+
+    Raises:
+        ValueError: If ``processes`` or ``chunksize`` is not positive.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes < 1 or chunksize < 1:
+        raise ValueError("The number of processes and the chunk size must be positive.")
+    if known_topologies is None:
+        known_topologies = Topology.known_topologies
+    topologies = iter(topologies)
+
+    if processes == 1:
+        registry = known_topologies
+        if not isinstance(registry, TopologyRegistry):
+            registry = TopologyRegistry(registry)
+        return _classify_serially(topologies, registry)
+
+    known_payloads = {name: _encode(topology) for name, topology in known_topologies.items()}
+    return _classify_in_pool(topologies, known_payloads, processes, chunksize)
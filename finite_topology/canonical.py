@@ -0,0 +1,328 @@
+"""
+Canonical labelling of finite topologies.
+
+A finite topology is determined by the minimal neighborhoods :math:`U_x` of its points, that is, by its
+specialization preorder. Two finite spaces are homeomorphic exactly when their preorders are isomorphic, so a
+canonical labelling of the preorder gives a certificate of the homeomorphism class, in the same way graph
+canonisation tools produce graph certificates.
+
+The functions of this module work on lists of neighborhood masks: entry ``i`` is the bitmask of :math:`U_i`,
+with the points indexed ``0..n-1``, and ``up_sets[i]`` is the mask of the points whose neighborhood contains
+``i``.
+"""
+from typing import List, NamedTuple, Optional, Tuple
+
+from . import instrumentation
+
+
+def _bits(mask: int) -> list:
+    """
+    Returns the indices of the bits set in a mask, in ascending order.
+    """
+    bits = []
+    while mask:
+        lowest = mask & -mask
+        bits.append(lowest.bit_length() - 1)
+        mask ^= lowest
+    return bits
+
+
+def _popcount(mask: int) -> int:
+    """
+    Returns the number of bits set in a mask.
+    """
+    return bin(mask).count("1")
+
+
+def _rank(values: list) -> list:
+    """
+    Replaces every value by its rank among the distinct values.
+    """
+    ranks = {value: i for i, value in enumerate(sorted(set(values)))}
+    return [ranks[value] for value in values]
+
+
+def initial_colouring(neighborhoods: List[int], up_sets: List[int]) -> list:
+    """
+    Colours the points by invariants that do not depend on the labelling: the size of the minimal
+    neighborhood and the sizes of the down-set and up-set.
+
+    Parameters:
+        neighborhoods (list[int]): Minimal neighborhood masks.
+        up_sets (list[int]): Up-set masks.
+
+    Returns:
+        list[int]: The colour of every point, as ranks starting at 0.
+    """
+    return _rank([(_popcount(down), _popcount(up)) for down, up in zip(neighborhoods, up_sets)])
+
+
+def refine_colouring(neighborhoods: List[int], up_sets: List[int], colours: list) -> list:
+    """
+    Refines a colouring until it is equitable with respect to the specialization preorder.
+
+    In every round a point is recoloured by its current colour together with the multisets of colours of its
+    down-set and of its up-set. Cells are only split and the relative order of the cells is kept, and colours
+    are ranks of label independent signatures, so the result does not depend on how the points are indexed.
+
+    Parameters:
+        neighborhoods (list[int]): Minimal neighborhood masks.
+        up_sets (list[int]): Up-set masks.
+        colours (list[int]): The colouring to refine.
+
+    Returns:
+        list[int]: The refined colouring, as ranks starting at 0.
+    """
+    return _refine([_bits(mask) for mask in neighborhoods], [_bits(mask) for mask in up_sets], colours)
+
+
+def _refine(down_bits: list, up_bits: list, colours: list) -> list:
+    """
+    Refines a colouring like :func:`refine_colouring`, given the down-sets and up-sets as lists of indices.
+    """
+    colours = _rank(colours)
+    cells = max(colours, default=-1) + 1
+    while cells < len(colours):
+        signatures = [(colours[x],
+                       tuple(sorted(colours[y] for y in down_bits[x])),
+                       tuple(sorted(colours[y] for y in up_bits[x])))
+                      for x in range(len(colours))]
+        refined = _rank(signatures)
+        refined_cells = max(refined) + 1
+        if refined_cells == cells:
+            break
+        colours, cells = refined, refined_cells
+    return colours
+
+
+def individualize(colours: list, point: int) -> list:
+    """
+    Splits the cell of a point, placing the point in a cell of its own just before the rest of the cell.
+    """
+    return _rank([2 * colour + (0 if x != point else -1) for x, colour in enumerate(colours)])
+
+
+def relabel(mask: int, labelling: list) -> int:
+    """
+    Relabels a mask, sending bit ``i`` to bit ``labelling[i]``.
+    """
+    relabelled = 0
+    for i in _bits(mask):
+        relabelled |= 1 << labelling[i]
+    return relabelled
+
+
+def _leaf_certificate(neighborhoods: List[int], labelling: list) -> tuple:
+    """
+    Encodes the neighborhoods relabelled by a discrete colouring, listed by their new label.
+    """
+    certificate = [0] * len(labelling)
+    for x, position in enumerate(labelling):
+        certificate[position] = relabel(neighborhoods[x], labelling)
+    return tuple(certificate)
+
+
+class CanonicalForm(NamedTuple):
+    """
+    Result of the canonical labelling search.
+
+    Attributes:
+    - certificate (tuple): The neighborhood masks relabelled canonically, listed by label. Equal certificates
+      mean homeomorphic topologies.
+    - labelling (list): ``labelling[i]`` is the canonical label of point ``i``.
+    - generators (list): Automorphisms found by the search, as lists mapping each point index to its image.
+      They generate the whole automorphism group.
+    - group_order (int): The order of the automorphism group.
+    """
+    certificate: tuple
+    labelling: list
+    generators: list
+    group_order: int
+
+
+class _DisjointSets:
+    """
+    Union-find over the points, used to track orbits of the automorphisms found during the search.
+    """
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.sizes = [1] * n  # Only meaningful at the roots
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int):
+        x, y = self.find(x), self.find(y)
+        if x != y:
+            root, child = min(x, y), max(x, y)
+            self.parent[child] = root
+            self.sizes[root] += self.sizes[child]
+
+    def size(self, x: int) -> int:
+        return self.sizes[self.find(x)]
+
+
+def orbits(n: int, generators: list) -> list:
+    """
+    Computes the orbits of the group generated by a list of permutations of ``0..n-1``.
+
+    Parameters:
+        n (int): The number of points.
+        generators (list): Permutations, as lists mapping each point to its image.
+
+    Returns:
+        list[int]: For every point, the smallest point of its orbit.
+    """
+    sets = _DisjointSets(n)
+    for generator in generators:
+        for x, y in enumerate(generator):
+            sets.union(x, y)
+    return [sets.find(x) for x in range(n)]
+
+
+class _CanonicalSearch:
+    """
+    Individualisation-refinement search for the canonical labelling of a preorder.
+
+    Every node of the search tree is an equitable colouring; its children individualise each point of the
+    first non-singleton cell. Leaves are discrete colourings, read as labellings, and the canonical labelling is
+    the leaf with the smallest certificate. Two leaves with the same certificate differ by an automorphism,
+    which is recorded and used to skip children in the same orbit, and to abandon a subtree as soon as it is
+    known to be an image of one already explored.
+
+    The automorphisms found generate the whole group, and those fixing a prefix of the first path generate
+    its stabilizer, so the group order is the product, along the first path, of the orbit sizes of the
+    individualized points under those stabilizers.
+    """
+
+    def __init__(self, neighborhoods: List[int], up_sets: List[int]):
+        self.neighborhoods = neighborhoods
+        self.up_sets = up_sets
+        self.n = len(neighborhoods)
+        # Down-sets and up-sets as lists of indices, shared by the refinements of every node
+        self.down_bits = [_bits(mask) for mask in neighborhoods]
+        self.up_bits = [_bits(mask) for mask in up_sets]
+        self.first = None  # (certificate, labelling, path) of the first leaf
+        self.best = None  # (certificate, labelling, path) of the smallest leaf found
+        self.generators = []
+        self.group_order = 1
+
+    def run(self):
+        colours = _refine(self.down_bits, self.up_bits, initial_colouring(self.neighborhoods, self.up_sets))
+        self._visit(colours, [])
+
+    def _add_to_orbits(self, orbits: _DisjointSets, path: list, generators: list):
+        """
+        Merges into ``orbits`` the orbits of the given automorphisms that fix every point of the path.
+        """
+        for generator in generators:
+            if all(generator[x] == x for x in path):
+                for x, y in enumerate(generator):
+                    orbits.union(x, y)
+
+    def _visit(self, colours: list, path: list) -> Optional[int]:
+        """
+        Explores the subtree of a node. Returns None, or the depth the search has to unwind to when the
+        subtree is found to be equivalent to one already explored.
+        """
+        cells = {}
+        for x, colour in enumerate(colours):
+            cells.setdefault(colour, []).append(x)
+        if len(cells) == self.n:
+            return self._leaf(colours, path)
+
+        # Target cell: the first non-singleton cell, a choice that does not depend on the labelling
+        target = next(cells[colour] for colour in sorted(cells) if len(cells[colour]) > 1)
+
+        # Orbits of the automorphisms fixing the path. They are built once for the node, when a second child is
+        # considered (most subtrees unwind before that), and extended with the automorphisms found afterwards.
+        orbits = None
+        known = 0
+        explored = []
+        for point in target:
+            if explored:
+                if orbits is None:
+                    orbits = _DisjointSets(self.n)
+                if len(self.generators) > known:
+                    self._add_to_orbits(orbits, path, self.generators[known:])
+                    known = len(self.generators)
+                if any(orbits.find(point) == orbits.find(other) for other in explored):
+                    continue
+            explored.append(point)
+            child = _refine(self.down_bits, self.up_bits, individualize(colours, point))
+            unwind = self._visit(child, path + [point])
+            if unwind is not None and unwind < len(path):
+                return unwind
+
+        # Nodes of the first path are always explored completely
+        first_path = self.first[2]
+        if first_path[:len(path)] == path:
+            if orbits is None:
+                orbits = _DisjointSets(self.n)
+            self._add_to_orbits(orbits, path, self.generators[known:])
+            self.group_order *= orbits.size(first_path[len(path)])
+        return None
+
+    def _leaf(self, labelling: list, path: list) -> Optional[int]:
+        if instrumentation.active:
+            instrumentation.count("canonical_leaves")
+        certificate = _leaf_certificate(self.neighborhoods, labelling)
+        if self.first is None:
+            self.first = self.best = (certificate, labelling, path)
+            return None
+        for reference in (self.first, self.best):
+            if certificate == reference[0]:
+                # Same certificate: the map between the two leaves is an automorphism, and the whole subtree
+                # below the point where the paths diverge is an image of one already explored.
+                position_to_point = [0] * self.n
+                for x, position in enumerate(labelling):
+                    position_to_point[position] = x
+                self.generators.append([position_to_point[position] for position in reference[1]])
+                common = 0
+                while common < len(path) and path[common] == reference[2][common]:
+                    common += 1
+                return common
+        if certificate < self.best[0]:
+            self.best = (certificate, labelling, path)
+        return None
+
+
+def canonical_labelling(neighborhoods: List[int], up_sets: List[int]) -> Tuple[tuple, list]:
+    """
+    Computes the canonical labelling of a finite topology given by its minimal neighborhoods.
+
+    Parameters:
+        neighborhoods (list[int]): Minimal neighborhood masks.
+        up_sets (list[int]): Up-set masks.
+
+    Returns:
+        tuple: ``(certificate, labelling)``. ``labelling[i]`` is the canonical label of point ``i``, and the
+        certificate is the tuple of the neighborhood masks relabelled canonically and listed by label. Two
+        topologies are homeomorphic if and only if their certificates are equal.
+    """
+    form = canonical_form(neighborhoods, up_sets)
+    return form.certificate, form.labelling
+
+
+def canonical_form(neighborhoods: List[int], up_sets: List[int]) -> CanonicalForm:
+    """
+    Computes the canonical labelling of a finite topology together with its automorphism group.
+
+    Parameters:
+        neighborhoods (list[int]): Minimal neighborhood masks.
+        up_sets (list[int]): Up-set masks.
+
+    Returns:
+        CanonicalForm: Certificate, canonical labelling, generators and order of the automorphism group.
+    """
+    if not neighborhoods:
+        return CanonicalForm((), [], [], 1)
+    search = _CanonicalSearch(neighborhoods, up_sets)
+    search.run()
+    certificate, labelling, _ = search.best
+    return CanonicalForm(certificate, labelling, search.generators, search.group_order)
@@ -0,0 +1,154 @@
+"""
+Catalogue files of many topologies, read through a memory map.
+
+A catalogue stores the :meth:`Topology.to_bytes` encodings of a sequence of topologies one after the other,
+followed by a table with the offset of every record. The file starts with a fixed header:
+
+- the magic bytes ``FTCAT001``,
+- the number of topologies, as an unsigned 64-bit little-endian integer,
+- the offset of the table, in the same format.
+
+The table holds ``count + 1`` offsets, so record ``i`` spans ``offsets[i]:offsets[i + 1]``. Since the offsets
+are written last, a catalogue is written in a single pass over an iterator of topologies, and
+:class:`TopologyCatalogue` decodes a record only when it is accessed.
+
+Example:
+    >>> import os, tempfile
+    >>> from finite_topology.enumeration import generate_topologies
+    >>> directory = tempfile.TemporaryDirectory()
+    >>> path = os.path.join(directory.name, 'topologies_3.ftc')
+    >>> write_catalogue(path, generate_topologies(3))
+    29
+    >>> with TopologyCatalogue(path) as catalogue:
+    ...     catalogue[28].count_open_sets()
+    8
+    >>> directory.cleanup()
+"""
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Iterable, Union
+
+from .topology import Topology
+
+MAGIC = b"FTCAT001"
+_HEADER = struct.Struct("<8sQQ")
+_OFFSET = struct.Struct("<Q")
+
+
+def write_catalogue(path, topologies: Iterable[Union[Topology, bytes]], labels: bool = True) -> int:
+    """
+    Writes a catalogue file with the given topologies, in order.
+
+    Parameters:
+        path (str or path-like): The file to write. An existing file is overwritten.
+        topologies (iterable): Topologies, or their encodings as returned by :meth:`Topology.to_bytes`.
+        labels (bool): Whether to store the points of the topologies, see :meth:`Topology.to_bytes`.
+
+    Returns:
+        int: The number of topologies written.
+
+    Raises:
+        ValueError: If a topology cannot be encoded.
+    """
+    offsets = array("Q")
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, 0, 0))
+        position = _HEADER.size
+        for topology in topologies:
+            record = topology.to_bytes(labels) if isinstance(topology, Topology) else bytes(topology)
+            offsets.append(position)
+            file.write(record)
+            position += len(record)
+        offsets.append(position)
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        file.write(offsets.tobytes())
+        file.seek(0)
+        file.write(_HEADER.pack(MAGIC, len(offsets) - 1, position))
+    return len(offsets) - 1
+
+
+class TopologyCatalogue(Sequence):
+    """
+    Read-only sequence of the topologies stored in a catalogue file.
+
+    The file is memory-mapped and nothing is decoded when it is opened: indexing reads the offset table and
+    decodes a single record with :meth:`Topology.from_bytes`, so any topology of a large catalogue is
+    available without loading the others. Slices return lists of topologies.
+
+    Instance Attributes:
+    - path: The catalogue file.
+    """
+
+    def __init__(self, path):
+        """
+        Opens a catalogue file.
+
+        Parameters:
+            path (str or path-like): The catalogue file, as written by :func:`write_catalogue`.
+
+        Raises:
+            ValueError: If the file is not a catalogue.
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            size = file.seek(0, 2)
+            if size < _HEADER.size:
+                raise ValueError(f"{path} is not a topology catalogue.")
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, self._table = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or self._table + (self._count + 1) * _OFFSET.size != size:
+            self._map.close()
+            raise ValueError(f"{path} is not a topology catalogue.")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _span(self, index: int) -> tuple:
+        """
+        Returns the start and end offsets of a record, accepting negative indices.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Catalogue index out of range.")
+        position = self._table + index * _OFFSET.size
+        start, = _OFFSET.unpack_from(self._map, position)
+        end, = _OFFSET.unpack_from(self._map, position + _OFFSET.size)
+        return start, end
+
+    def get_bytes(self, index: int) -> bytes:
+        """
+        Returns the encoding of a topology without decoding it.
+
+        Parameters:
+            index (int): The position of the topology in the catalogue.
+
+        Returns:
+            bytes: The record, as returned by :meth:`Topology.to_bytes`.
+        """
+        start, end = self._span(index)
+        return self._map[start:end]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        return Topology.from_bytes(self.get_bytes(index))
+
+    def close(self):
+        """
+        Closes the memory map. The topologies already read stay valid.
+        """
+        self._map.close()
+
+    def __enter__(self) -> 'TopologyCatalogue':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"TopologyCatalogue({self.path!r}, {self._count} topologies)"
@@ -0,0 +1,108 @@
+"""
+Diagnostics reported by the predicates of the library.
+
+Methods such as :meth:`Topology.is_open` or :meth:`Topology.is_T0` explain their negative answers (the set that is
+not open, the pair of points that cannot be separated, ...). These explanations are silent by default: nothing
+is formatted or written unless a handler is installed, so the predicates stay cheap in loops.
+
+- :func:`set_verbose` prints every diagnostic, as the library did in previous versions.
+- :func:`capture` collects the diagnostics of a block as :class:`Diagnostic` objects, with the witness data.
+
+Example:
+    >>> from finite_topology import diagnostics
+    >>> from finite_topology.topology import Topology
+    >>> topology = Topology({1, 2}, [set(), {1, 2}])
+    >>> with diagnostics.capture() as reports:
+    ...     topology.is_T0()
+    False
+    >>> reports[0].details
+    {'points': (1, 2)}
+"""
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, NamedTuple
+
+
+class Diagnostic(NamedTuple):
+    """
+    Explanation of a result given by a predicate.
+
+    Attributes:
+    - kind (str): What happened, e.g. ``'not_open'``, ``'not_T0'`` or ``'set_added'``.
+    - message (str): Human readable description, the text printed in verbose mode.
+    - details (dict): The witness data, e.g. the subset or the pair of points involved.
+    """
+    kind: str
+    message: str
+    details: dict
+
+
+# Installed handlers, the innermost last. Diagnostics are reported only when there is at least one.
+_handlers: List[Callable[[Diagnostic], None]] = []
+
+
+def _print_handler(diagnostic: Diagnostic):
+    print(diagnostic.message)
+
+
+def enabled() -> bool:
+    """
+    Checks if diagnostics are being reported. Callers test it before formatting a message, so the silent mode
+    costs a single call.
+    """
+    return bool(_handlers)
+
+
+def report(kind: str, message: str, **details):
+    """
+    Reports a diagnostic to the innermost handler.
+
+    Parameters:
+        kind (str): What happened.
+        message (str): Human readable description.
+        **details: Witness data.
+    """
+    if _handlers:
+        _handlers[-1](Diagnostic(kind, message, details))
+
+
+def set_verbose(verbose: bool = True):
+    """
+    Switches printing of the diagnostics on or off for the whole program.
+
+    With ``verbose=True`` the predicates print the same messages as previous versions of the library.
+
+    Parameters:
+        verbose (bool): True to print the diagnostics, False to silence them.
+    """
+    while _print_handler in _handlers:
+        _handlers.remove(_print_handler)
+    if verbose:
+        _handlers.insert(0, _print_handler)
+
+
+@contextmanager
+def verbose() -> Iterator[None]:
+    """
+    Prints the diagnostics reported inside the block.
+    """
+    _handlers.append(_print_handler)
+    try:
+        yield
+    finally:
+        _handlers.pop()
+
+
+@contextmanager
+def capture() -> Iterator[List[Diagnostic]]:
+    """
+    Collects the diagnostics reported inside the block instead of printing them.
+
+    Returns:
+        list[Diagnostic]: The list the diagnostics are appended to, in the order they are reported.
+    """
+    reports = []
+    _handlers.append(reports.append)
+    try:
+        yield reports
+    finally:
+        _handlers.pop()
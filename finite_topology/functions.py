@@ -1,4 +1,7 @@
-from .topology import Topology
+from typing import Iterator, Optional, Tuple
+
+from . import instrumentation
+from .topology import Topology, _iter_bits, _popcount
 
 
 class Function:
@@ -32,30 +35,118 @@ class Function:
         self.source = source
         self.target = target
         self.mapping = mapping
+        # Index of the image of every source point, following the bit order of the source masks
+        self._image_bits = [target._index[mapping[point]] for point in source._points]
+
+    def _preimage_mask(self, target_mask: int) -> int:
+        """
+        Computes the mask of the preimage of a set of the target, given as a target mask.
+        """
+        preimage = 0
+        for i, j in enumerate(self._image_bits):
+            if (target_mask >> j) & 1:
+                preimage |= 1 << i
+        return preimage
+
+    def _image_mask(self, source_mask: int) -> int:
+        """
+        Computes the mask of the image of a set of the source, given as a source mask.
+        """
+        image_bits = self._image_bits
+        image = 0
+        for i in range(len(image_bits)):
+            if (source_mask >> i) & 1:
+                image |= 1 << image_bits[i]
+        return image
+
+    def _between_topologies(self) -> bool:
+        """
+        Checks that source and target are topologies, so the order characterisations apply. Reads the cached
+        property profiles, so the collections are only validated once.
+        """
+        return self.source.properties().is_topology and self.target.properties().is_topology
+
+    def find_continuity_violation(self) -> Optional[Tuple]:
+        """
+        Finds a pair of points that shows that the function is not continuous.
+
+        A map between finite spaces is continuous exactly when it preserves the specialization preorder:
+        :math:`x \\in U_y` implies :math:`f(x) \\in U_{f(y)}`. Equivalently :math:`f(U_y) \\subseteq U_{f(y)}` for
+        every point, which is checked in :math:`O(n^2)` from the minimal neighborhoods of both spaces.
+
+        Returns:
+            tuple or None: A pair ``(x, y)`` of source points with :math:`x \\in U_y` but
+            :math:`f(x) \\notin U_{f(y)}`, or None if the function is continuous.
+        """
+        source_points = self.source._points
+        image_bits = self._image_bits
+        target_neighborhoods = self.target._neighborhood_masks()
+        for y, neighborhood in enumerate(self.source._neighborhood_masks()):
+            target_neighborhood = target_neighborhoods[image_bits[y]]
+            for x in _iter_bits(neighborhood):
+                if not (target_neighborhood >> image_bits[x]) & 1:
+                    return source_points[x], source_points[y]
+        return None
+
+    def find_open_mapping_violation(self) -> Optional[Tuple]:
+        """
+        Finds a pair of points that shows that the function is not an open mapping.
+
+        Every open set is the union of the minimal neighborhoods of its points and images preserve unions, so the
+        function is open exactly when every :math:`f(U_x)` is open, that is, when :math:`U_z \\subseteq f(U_x)` for
+        every :math:`z \\in f(U_x)`.
+
+        Returns:
+            tuple or None: A pair ``(x, z)``, a source point and a target point, such that :math:`z` is missing from
+            :math:`f(U_x)` although it lies in the minimal neighborhood of one of its points, or None if the
+            function is an open mapping.
+        """
+        target_neighborhoods = self.target._neighborhood_masks()
+        for x, neighborhood in enumerate(self.source._neighborhood_masks()):
+            image = self._image_mask(neighborhood)
+            for z in _iter_bits(image):
+                missing = target_neighborhoods[z] & ~image
+                if missing:
+                    return self.source._points[x], self.target._points[(missing & -missing).bit_length() - 1]
+        return None
 
     def is_continuous(self) -> bool:
         """
         Checks if the function is continuous.
+
+        Between topologies this is the order check of :meth:`find_continuity_violation`. If the source or the
+        target collection is not a topology, the preimage of every member of the target is looked up instead.
         """
+        if self._between_topologies():
+            return self.find_continuity_violation() is None
+
         # For each open set in the target space, verify that the preimage is open in the source space
-        for open_set in self.target.collection_of_subsets:
-            preimage = self.get_preimage(open_set)
-            if preimage not in self.source.collection_of_subsets:
-                # Uncomment the print statement if you want to see which preimage is not open
-                # print(f"The preimage of {sorted(open_set)} is {sorted(preimage)}, which is not open in the source space.")
+        if instrumentation.active:
+            instrumentation.count("collection_scans")
+        source_open_masks = self.source._open_mask_set()
+        for open_mask in self.target._open_mask_set():
+            preimage = self._preimage_mask(open_mask)
+            if preimage not in source_open_masks:
                 return False
         return True
 
     def is_open_mapping(self) -> bool:
         """
         Checks if the function is an open mapping.
+
+        Between topologies this is the check of :meth:`find_open_mapping_violation`. If the source or the target
+        collection is not a topology, the image of every member of the source is looked up instead.
         """
+        if self._between_topologies():
+            return self.find_open_mapping_violation() is None
+
         # For each open set in the source space, verify that the image is open in the target space
-        for open_set in self.source.collection_of_subsets:
-            image = self.get_image(open_set)
-            if image not in self.target.collection_of_subsets:
-                # Uncomment the print statement if you want to see which image is not open
-                # print(f"The image of {sorted(open_set)} is {sorted(image)}, which is not open in the target space.")
+        if instrumentation.active:
+            instrumentation.count("collection_scans")
+        target_open_masks = self.target._open_mask_set()
+        for open_mask in self.source._open_mask_set():
+            image = self._image_mask(open_mask)
+            if image not in target_open_masks:
                 return False
         return True
 
@@ -92,10 +183,20 @@ class Function:
     def is_homeomorphism(self) -> bool:
         """
         Checks if the function is a homeomorphism.
+
+        Between topologies a bijection is a homeomorphism exactly when it maps every minimal neighborhood onto the
+        minimal neighborhood of the image, :math:`f(U_x) = U_{f(x)}`, which is an order isomorphism of the
+        specialization preorders.
         """
         if not self.is_bijective():
             return False
 
+        if self._between_topologies():
+            target_neighborhoods = self.target._neighborhood_masks()
+            image_bits = self._image_bits
+            return all(self._image_mask(neighborhood) == target_neighborhoods[image_bits[x]]
+                       for x, neighborhood in enumerate(self.source._neighborhood_masks()))
+
         # Create the inverse function
         inverse_mapping = {v: k for k, v in self.mapping.items()}
         try:
@@ -151,8 +252,165 @@ class Function:
         # Build properties string
         properties_str = ', '.join(properties)
 
+        source_str = [sorted(s) for s in self.source.get_ordered_subsets()]
+        target_str = [sorted(s) for s in self.target.get_ordered_subsets()]
+
         return (f"Function(\n"
-                f"  Source Topology: {self.source.collection_of_subsets}\n"
-                f"  Target Topology: {self.target.collection_of_subsets}\n"
+                f"  Source Topology: {source_str}\n"
+                f"  Target Topology: {target_str}\n"
                 f"  Mapping: {{ {mapping_str} }}\n"
                 f"  Properties: {properties_str}\n)")
+
+
+def _search_components(source: Topology) -> list:
+    """
+    Splits the source points into connected components, each listed in breadth first order so that every point
+    after the first is comparable to an earlier one and the domains shrink as early as possible.
+    """
+    neighborhoods = source._neighborhood_masks()
+    up_sets = source._up_set_masks()
+    components = []
+    placed = 0
+    for start in range(len(neighborhoods)):
+        if (placed >> start) & 1:
+            continue
+        component = [start]
+        placed |= 1 << start
+        for x in component:
+            for y in _iter_bits((neighborhoods[x] | up_sets[x]) & ~placed):
+                placed |= 1 << y
+                component.append(y)
+        components.append(component)
+    return components
+
+
+class _MapSearch:
+    """
+    Backtracking over the continuous maps between two finite spaces, as assignments of target indices to the
+    source indices.
+
+    Every source point has a domain, the mask of its admissible images. Assigning :math:`f(x) = v` restricts
+    the points below :math:`x` to :math:`U_v` and the points above :math:`x` to the up-set of :math:`v`, and a
+    branch is abandoned as soon as a domain becomes empty. Since the only constraints are between comparable
+    pairs, the unassigned domains summarise everything that has been assigned.
+    """
+
+    def __init__(self, source: Topology, target: Topology, order: list):
+        self.source_neighborhoods = source._neighborhood_masks()
+        self.source_up_sets = source._up_set_masks()
+        self.target_neighborhoods = target._neighborhood_masks()
+        self.target_up_sets = target._up_set_masks()
+        self.order = order
+        # Mask of the source points assigned after position k
+        self.after = [0] * len(order)
+        pending = 0
+        for k in range(len(order) - 1, -1, -1):
+            self.after[k] = pending
+            pending |= 1 << order[k]
+        self.full_domains = [target._full_mask] * len(source._points)
+
+    def _assign(self, domains: list, k: int, value: int) -> Optional[list]:
+        """
+        Returns the domains after assigning ``value`` to the ``k``-th point, or None if one becomes empty.
+        """
+        if instrumentation.active:
+            instrumentation.count("continuous_map_nodes")
+        x = self.order[k]
+        pending = self.after[k]
+        domains = domains.copy()
+        for y in _iter_bits(self.source_neighborhoods[x] & pending):
+            domains[y] &= self.target_neighborhoods[value]
+            if not domains[y]:
+                return None
+        for y in _iter_bits(self.source_up_sets[x] & pending):
+            domains[y] &= self.target_up_sets[value]
+            if not domains[y]:
+                return None
+        return domains
+
+    def assignments(self, k: int = 0, domains: Optional[list] = None, image: Optional[list] = None) -> Iterator[list]:
+        """
+        Yields ``image`` lists, ``image[x]`` being the target index of source index ``x``. The same list is
+        reused between results.
+        """
+        if domains is None:
+            domains, image = self.full_domains, [0] * len(self.full_domains)
+        if k == len(self.order):
+            yield image
+            return
+        x = self.order[k]
+        for value in _iter_bits(domains[x]):
+            restricted = self._assign(domains, k, value)
+            if restricted is not None:
+                image[x] = value
+                yield from self.assignments(k + 1, restricted, image)
+
+    def count(self, k: int = 0, domains: Optional[list] = None, memo: Optional[dict] = None) -> int:
+        """
+        Counts the assignments without listing them. Subproblems are memoised on the domains of the points not
+        yet assigned, which determine them completely.
+        """
+        if domains is None:
+            domains, memo = self.full_domains, {}
+        n = len(self.order)
+        if k == n:
+            return 1
+        x = self.order[k]
+        if k == n - 1:
+            return _popcount(domains[x])
+        key = (k,) + tuple(domains[self.order[j]] for j in range(k, n))
+        if key in memo:
+            return memo[key]
+        total = 0
+        for value in _iter_bits(domains[x]):
+            restricted = self._assign(domains, k, value)
+            if restricted is not None:
+                total += self.count(k + 1, restricted, memo)
+        memo[key] = total
+        return total
+
+
+def generate_continuous_maps(source: Topology, target: Topology) -> Iterator[Function]:
+    """
+    Generates every continuous map from one finite space to another, one at a time.
+
+    A map is continuous exactly when it preserves the specialization preorder, so the maps are built point by
+    point by backtracking, discarding an image as soon as some comparable point is left without an admissible
+    image. The :math:`|Y|^{|X|}` mappings are never enumerated. Collections that are not topologies are replaced
+    by the topologies they generate.
+
+    Parameters:
+        source (Topology): The source space.
+        target (Topology): The target space.
+
+    Returns:
+        Iterator[Function]: The continuous maps from source to target, each one exactly once.
+    """
+    source_points = source._points
+    target_points = target._points
+    order = [x for component in _search_components(source) for x in component]
+    for image in _MapSearch(source, target, order).assignments():
+        mapping = {point: target_points[value] for point, value in zip(source_points, image)}
+        yield Function(source, target, mapping)
+
+
+def count_continuous_maps(source: Topology, target: Topology) -> int:
+    """
+    Counts the continuous maps from one finite space to another without building them.
+
+    The search of :func:`generate_continuous_maps` is run on every connected component of the source, as the
+    number of maps is the product over the components, and identical subproblems are counted once.
+
+    Parameters:
+        source (Topology): The source space.
+        target (Topology): The target space.
+
+    Returns:
+        int: The number of continuous maps from source to target.
+    """
+    total = 1
+    for component in _search_components(source):
+        total *= _MapSearch(source, target, component).count()
+        if not total:
+            break
+    return total
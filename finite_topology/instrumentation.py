@@ -0,0 +1,182 @@
+"""
+Opt-in instrumentation of the library: operation counters and wall time per method.
+
+Inside an :func:`instrument` block the library counts the operations of its potentially expensive loops and
+times the calls to every public method of :class:`~finite_topology.topology.Topology`,
+:class:`~finite_topology.topology.TopologyRegistry` and :class:`~finite_topology.functions.Function`. The
+block yields an :class:`InstrumentationReport` that is filled while it runs.
+
+The methods are only wrapped while a block is active, and the counters are guarded by the module flag
+:data:`active`, so outside a block the cost is one attribute lookup at each counting site. The counters are:
+
+- ``set_conversions``: subsets encoded as bitmasks or decoded back into Python sets.
+- ``open_set_lookups``: membership checks of a mask in the collection of open sets.
+- ``collection_scans``: loops over every member of a collection of subsets.
+- ``open_sets_listed``: open sets listed from the minimal neighborhoods of lazy topologies.
+- ``permutations_tried``: bijections tried by the brute force comparison of collections that are not
+  topologies, in :meth:`Topology.is_structurally_equal` and :meth:`Topology.find_homeomorphism`.
+- ``canonical_leaves``: leaves of the canonical labelling search (see :mod:`finite_topology.canonical`).
+- ``continuous_map_nodes``: partial assignments tried by the continuous map search.
+
+Example:
+    >>> from finite_topology import instrumentation
+    >>> from finite_topology.topology import Topology
+    >>> with instrumentation.instrument() as report:
+    ...     Topology({1, 2, 3}, [set(), {1}, {1, 2, 3}]).is_open({1})
+    True
+    >>> report.calls['Topology.is_open'], report.counters['set_conversions']
+    (1, 4)
+
+Blocks can be nested, and every active report records the work done inside it. The instrumentation is not
+thread-safe.
+"""
+import functools
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, List
+
+# True while at least one report is being recorded. Counting sites test it before calling count().
+active = False
+
+# Reports being recorded, the innermost last
+_reports: List['InstrumentationReport'] = []
+
+# Number of instrumented methods currently running. Only the outermost call is counted, so the methods called
+# by the library itself do not add to the calls of the user.
+_depth = 0
+
+# Names of the instrumented methods currently running, so recursive calls are timed once
+_running = set()
+
+# Methods always instrumented besides the public ones
+_SPECIAL_METHODS = ("__init__", "__repr__", "__eq__", "__len__")
+
+
+class InstrumentationReport:
+    """
+    Counters and timings recorded by an :func:`instrument` block.
+
+    Instance Attributes:
+    - counters (Counter): Number of operations by counter name.
+    - calls (Counter): Number of calls by method name, e.g. ``'Topology.is_connected'``. Only calls made from
+      outside the instrumented methods are counted, not the ones a method makes to other public methods.
+    - times (Counter): Wall time in seconds by method name, including the methods it calls. Methods called by
+      other ones are timed as well, so a slow call breaks down into the methods it went through, but
+      recursive calls of a method are only timed once.
+    - elapsed (float): Wall time of the whole block, in seconds.
+    """
+
+    def __init__(self):
+        self.counters = Counter()
+        self.calls = Counter()
+        self.times = Counter()
+        self.elapsed = 0.0
+
+    def __str__(self) -> str:
+        lines = [f"Elapsed: {self.elapsed:.6f} s"]
+        if self.times:
+            lines.append("Methods (calls, total time):")
+            for name, seconds in self.times.most_common():
+                lines.append(f"  {name:<40} {self.calls[name]:>10} {seconds:>12.6f} s")
+        if self.counters:
+            lines.append("Counters:")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"  {name:<40} {value:>10}")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"InstrumentationReport(elapsed={self.elapsed:.6f}, counters={dict(self.counters)})"
+
+
+def count(name: str, amount: int = 1):
+    """
+    Adds to a counter of every active report.
+
+    Parameters:
+        name (str): The counter.
+        amount (int): The number of operations to add.
+    """
+    for report in _reports:
+        report.counters[name] += amount
+
+
+def _timed(name: str, function):
+    """
+    Wraps a function to record its calls and wall time in the active reports. Calls are only counted when no
+    other instrumented method is running, and recursive calls go straight to the function.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        global _depth
+        if name in _running:
+            return function(*args, **kwargs)
+        if not _depth:
+            for report in _reports:
+                report.calls[name] += 1
+        _depth += 1
+        _running.add(name)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            _depth -= 1
+            _running.discard(name)
+            for report in _reports:
+                report.times[name] += elapsed
+    return wrapper
+
+
+def _instrumented_classes() -> list:
+    from .functions import Function
+    from .topology import Topology, TopologyRegistry
+    return [Topology, TopologyRegistry, Function]
+
+
+def _patch() -> list:
+    """
+    Replaces the public methods of the instrumented classes by timed wrappers. Returns what is needed to
+    restore them.
+    """
+    originals = []
+    for cls in _instrumented_classes():
+        for attribute, value in list(vars(cls).items()):
+            if attribute.startswith("_") and attribute not in _SPECIAL_METHODS:
+                continue
+            name = f"{cls.__name__}.{attribute}"
+            if isinstance(value, (classmethod, staticmethod)):
+                wrapped = type(value)(_timed(name, value.__func__))
+            elif isinstance(value, property):
+                wrapped = property(_timed(name, value.fget), value.fset, value.fdel, value.__doc__)
+            elif callable(value):
+                wrapped = _timed(name, value)
+            else:
+                continue
+            originals.append((cls, attribute, value))
+            setattr(cls, attribute, wrapped)
+    return originals
+
+
+@contextmanager
+def instrument() -> Iterator[InstrumentationReport]:
+    """
+    Records the counters and method timings of the library inside the block.
+
+    Returns:
+        InstrumentationReport: The report, filled while the block runs and complete when it exits.
+    """
+    global active
+    report = InstrumentationReport()
+    originals = _patch() if not _reports else []
+    _reports.append(report)
+    active = True
+    start = time.perf_counter()
+    try:
+        yield report
+    finally:
+        report.elapsed = time.perf_counter() - start
+        _reports.remove(report)
+        active = bool(_reports)
+        for cls, attribute, value in reversed(originals):
+            setattr(cls, attribute, value)
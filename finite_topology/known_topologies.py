@@ -1,4 +1,3 @@
-from itertools import chain, combinations
 from .topology import Topology
 
 
@@ -21,9 +20,8 @@ def create_discrete_topology(space):
     Returns:
         Topology: An instance of the Topology class representing the discrete topology.
     """
-    subsets = list(chain.from_iterable(combinations(space, r) for r in range(len(space) + 1)))
-    subsets = [set(s) for s in subsets]
-    return Topology(space, subsets)
+    # The singletons are a basis, so the 2^n open sets are never listed up front
+    return Topology.from_basis(space, [{x} for x in space])
 
 
 def create_trivial_topology(space):
@@ -88,15 +86,9 @@ def create_particular_point_topology(space, particular_point):
     if particular_point not in space:
         raise ValueError("The particular point must be an element of the space.")
 
-    # All subsets that contain the particular point, plus the empty set
-    subsets = [set(), set(space)]
-    for r in range(1, len(space)):
-        for subset in combinations(space, r):
-            subset = set(subset)
-            if particular_point in subset:
-                subsets.append(subset)
-
-    return Topology(space, subsets)
+    # All subsets that contain the particular point, plus the empty set. They are the unions of the basic sets
+    # {p, x}, the minimal neighborhoods of the points.
+    return Topology.from_basis(space, [{particular_point, x} for x in space])
 
 
 def create_excluded_point_topology(space, excluded_point):
@@ -118,50 +110,32 @@ def create_excluded_point_topology(space, excluded_point):
     if excluded_point not in space:
         raise ValueError("The excluded point must be an element of the space.")
 
-    # All subsets that do not contain the excluded point, plus the entire space
-    subsets = [set(), set(space)]
-    for r in range(1, len(space)):
-        for subset in combinations(space, r):
-            subset = set(subset)
-            if excluded_point not in subset:
-                subsets.append(subset)
-
-    return Topology(space, subsets)
+    # All subsets that do not contain the excluded point, plus the entire space. They are the unions of the
+    # singletons of the other points and the entire space, the only open set containing the excluded point.
+    return Topology.from_basis(space, [{x} for x in space if x != excluded_point] + [set(space)])
 
 
 def create_divisibility_topology(space):
     """
-    Create an excluded point topology on the given space.
+    Create the divisibility topology on a set of non-zero integers.
 
-    An **excluded point topology** on a set :math:`X` is defined such that the only open sets are those that do not contain a particular point :math:`e \\in X`, plus the entire set and the empty set.
+    The open sets of the **divisibility topology** are generated by the sets of multiples of each element,
+    :math:`M_a = \\{ x \\in X : a \\mid x \\}`, so a set is open when it contains the multiples in :math:`X` of each of
+    its elements.
 
     Parameters:
-        space (set): The set on which the topology is defined.
-        excluded_point: The point that is excluded from all non-empty open sets.
+        space (set): The set of non-zero integers on which the topology is defined.
 
     Returns:
-        Topology: An instance of the Topology class representing the excluded point topology.
-
-    Raises:
-        ValueError: If the excluded point is not an element of the space.
+        Topology: An instance of the Topology class representing the divisibility topology.
     """
-    subsets = [set(), set(space)]
+    subsets = []
     for element in space:
         multiples = {x for x in space if x % element == 0}
         subsets.append(multiples)
 
-    # Ensure the topology is closed under arbitrary unions
-    # For simplicity in finite cases, include all unions of the basic open sets
-    n = len(subsets)
-    for i in range(1, 2 ** n):
-        union = set()
-        for j in range(n):
-            if (i >> j) & 1:
-                union = union.union(subsets[j])
-        if union not in subsets:
-            subsets.append(union)
-
-    return Topology(space, subsets)
+    # The topology generated by the sets of multiples, closed under unions and intersections
+    return Topology.generated_by(space, subsets)
 
 
 def create_topology_from_equivalence(space, equivalence_relation):
@@ -187,16 +161,7 @@ def create_topology_from_equivalence(space, equivalence_relation):
             visited.update(eq_class)
 
     # Open sets are unions of equivalence classes, including the empty set
-    subsets = [set()]
-    n = len(equivalence_classes)
-    for i in range(1, 2 ** n):
-        union = set()
-        for j in range(n):
-            if (i >> j) & 1:
-                union.update(equivalence_classes[j])
-        subsets.append(union)
-
-    return Topology(space, subsets)
+    return Topology.generated_by(space, equivalence_classes)
 
 
 def create_upward_closed_topology(space, order_relation):
@@ -223,22 +188,13 @@ def create_upward_closed_topology(space, order_relation):
         Topology: An instance of the Topology class representing the upward-closed topology.
     """
     # Generate upward-closed sets
-    subsets = [set(), set(space)]
+    subsets = []
     for element in space:
         upward_closed_set = order_relation[element]
         subsets.append(upward_closed_set)
 
     # Include unions of upward-closed sets
-    n = len(subsets)
-    for i in range(1, 2 ** n):
-        union = set()
-        for j in range(n):
-            if (i >> j) & 1:
-                union = union.union(subsets[j])
-        if union not in subsets:
-            subsets.append(union)
-
-    return Topology(space, subsets)
+    return Topology.generated_by(space, subsets)
 
 
 def create_alexandrov_topology(space, order_relation):
@@ -276,19 +232,5 @@ def create_alexandrov_topology(space, order_relation):
         upper_set = {x for x in space if order_relation(element, x)}
         upper_sets.append(upper_set)
 
-    # Open sets are arbitrary unions of upper sets, including the empty set
-    subsets = [set()]
-    n = len(upper_sets)
-    for i in range(1, 2 ** n):
-        union = set()
-        for j in range(n):
-            if (i >> j) & 1:
-                union.update(upper_sets[j])
-        if union not in subsets:
-            subsets.append(union)
-
-    # Ensure the whole space is included
-    if set(space) not in subsets:
-        subsets.append(set(space))
-
-    return Topology(space, subsets)
+    # Open sets are arbitrary unions of upper sets, including the empty set and the whole space
+    return Topology.generated_by(space, upper_sets)
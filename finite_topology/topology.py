@@ -1,19 +1,360 @@
-from typing import Union, Callable
-from itertools import permutations, combinations, chain
+import ast
+import sys
+from typing import Union, Callable, Optional, NamedTuple, Tuple
+from itertools import permutations, combinations, product
+from collections.abc import MutableMapping
+
+from . import diagnostics, instrumentation
+from .canonical import CanonicalForm, _DisjointSets, canonical_form, orbits
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed by the batch queries
+    np = None
+
+
+def _ordered_points(space) -> list:
+    """
+    Returns the points of a space in a deterministic order, sorted when the elements are comparable.
+    """
+    try:
+        return sorted(space)
+    except TypeError:
+        return list(space)
+
+
+def _iter_bits(mask: int):
+    """
+    Yields the indices of the bits set in a mask, in ascending order.
+    """
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def _popcount(mask: int) -> int:
+    """
+    Returns the number of bits set in a mask.
+    """
+    return bin(mask).count("1")
+
+
+def _permute_mask(mask: int, permutation) -> int:
+    """
+    Relabels a mask, sending bit ``i`` to bit ``permutation[i]``.
+    """
+    permuted = 0
+    for i in _iter_bits(mask):
+        permuted |= 1 << permutation[i]
+    return permuted
+
+
+def _write_varint(buffer: bytearray, value: int):
+    """
+    Appends a non-negative integer to a buffer as an unsigned LEB128 varint.
+    """
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data, position: int) -> Tuple[int, int]:
+    """
+    Reads an unsigned LEB128 varint, returning ``(value, next_position)``.
+    """
+    value = shift = 0
+    while True:
+        if position >= len(data):
+            raise ValueError("Truncated topology encoding.")
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def _iter_down_sets(neighborhoods: list, up_sets: list, free: int):
+    """
+    Yields the masks of the down-sets of a preorder contained in ``free``, that is, the open sets of the
+    topology with the given minimal neighborhoods.
+
+    ``free`` must be down-closed. The search branches on the highest free point: either it is excluded,
+    together with every point above it, or it is included with its whole minimal neighborhood. Every branch
+    ends in a distinct down-set, so the cost is proportional to the number of sets produced.
+    """
+    stack = [(free, 0)]
+    while stack:
+        free, chosen = stack.pop()
+        if not free:
+            yield chosen
+            continue
+        x = free.bit_length() - 1
+        stack.append((free & ~up_sets[x], chosen))
+        stack.append((free & ~neighborhoods[x], chosen | (neighborhoods[x] & free)))
+
+
+# Masks up to this bit length are counted recursively: the depth of the recursion is bounded by the number of
+# points, and the recursion is faster than the explicit stack used for larger masks
+_RECURSIVE_COUNT_BITS = 64
+
+
+def _count_down_sets_recursively(neighborhoods: list, up_sets: list, free: int, memo: dict) -> int:
+    """
+    Counts the down-sets contained in ``free`` by recursion, splitting off the component of the last free point
+    or branching on that point. See :func:`_count_down_sets`.
+    """
+    if not free:
+        return 1
+    count = memo.get(free)
+    if count is not None:
+        return count
+
+    x = free.bit_length() - 1
+    component, frontier = 0, 1 << x
+    while frontier:
+        component |= frontier
+        reached = 0
+        for i in _iter_bits(frontier):
+            reached |= neighborhoods[i] | up_sets[i]
+        frontier = reached & free & ~component
+
+    if component != free:
+        count = (_count_down_sets_recursively(neighborhoods, up_sets, component, memo)
+                 * _count_down_sets_recursively(neighborhoods, up_sets, free & ~component, memo))
+    else:
+        count = (_count_down_sets_recursively(neighborhoods, up_sets, free & ~up_sets[x], memo)
+                 + _count_down_sets_recursively(neighborhoods, up_sets, free & ~neighborhoods[x], memo))
+    memo[free] = count
+    return count
+
+
+def _count_down_sets(neighborhoods: list, up_sets: list, free: int, memo: Optional[dict] = None) -> int:
+    """
+    Counts the down-sets of a preorder contained in the down-closed mask ``free`` without listing them.
+
+    The free points are split into connected components of the comparability relation, whose counts
+    multiply, and each component branches like :func:`_iter_down_sets` with memoisation on the free mask.
+    Large masks are expanded from an explicit stack instead of recursively, so the count works for any number
+    of points.
+    """
+    if memo is None:
+        memo = {}
+    memo[0] = 1
+    # Entries are (mask, None) before the mask is expanded, and (mask, parts) once the counts of its two parts
+    # are pending on the stack above it
+    stack = [(free, None)]
+    while stack:
+        mask, parts = stack.pop()
+        if parts is None:
+            if mask in memo:
+                continue
+            if mask.bit_length() <= _RECURSIVE_COUNT_BITS:
+                _count_down_sets_recursively(neighborhoods, up_sets, mask, memo)
+                continue
+            x = mask.bit_length() - 1
+            component, frontier = 0, 1 << x
+            while frontier:
+                component |= frontier
+                reached = 0
+                for i in _iter_bits(frontier):
+                    reached |= neighborhoods[i] | up_sets[i]
+                frontier = reached & mask & ~component
+            if component != mask:
+                # Independent parts: the component of x and the rest, whose counts multiply
+                parts = (True, component, mask & ~component)
+            else:
+                # Down-sets without x, and down-sets containing x and therefore its minimal neighborhood
+                parts = (False, mask & ~up_sets[x], mask & ~neighborhoods[x])
+            stack.append((mask, parts))
+            stack.append((parts[1], None))
+            stack.append((parts[2], None))
+            continue
+        is_product, first, second = parts
+        memo[mask] = memo[first] * memo[second] if is_product else memo[first] + memo[second]
+    return memo[free]
+
+
+class TopologyViolation(NamedTuple):
+    """
+    Witness that a collection of subsets is not a topology.
+
+    Attributes:
+    - kind (str): ``'empty_set'`` or ``'space'`` when that set is missing, ``'union'`` or ``'intersection'`` when
+      the collection is not closed under that operation.
+    - pair (tuple or None): The two members of the collection whose union or intersection is missing.
+    - missing (set): The set that should be in the collection and is not.
+    """
+    kind: str
+    pair: Optional[Tuple[set, set]]
+    missing: set
+
+    @property
+    def message(self) -> str:
+        """
+        Human readable description of the violation.
+        """
+        if self.kind == "empty_set":
+            return "The empty set is not in the collection."
+        if self.kind == "space":
+            return "The entire space is not in the collection."
+        return f"The {self.kind} {self.missing} is not in the collection."
+
+
+class AutomorphismGroup(NamedTuple):
+    """
+    The group of homeomorphisms of a finite space onto itself.
+
+    Attributes:
+    - generators (list[dict]): Automorphisms generating the group, as mappings from each point to its image.
+    - order (int): The number of automorphisms.
+    - orbits (list[set]): The orbits of the points under the group, ordered by their first point.
+    """
+    generators: list
+    order: int
+    orbits: list
+
+
+class TopologyProperties(NamedTuple):
+    """
+    Profile of the properties of a collection of subsets, as returned by :meth:`Topology.properties`.
+
+    Attributes:
+    - is_topology (bool): The collection is a topology.
+    - discrete, indiscrete, T0, T1, hausdorff, connected, compact, separable (bool): The results of the
+      corresponding ``is_*`` methods.
+    """
+    is_topology: bool
+    discrete: bool
+    indiscrete: bool
+    T0: bool
+    T1: bool
+    hausdorff: bool
+    connected: bool
+    compact: bool
+    separable: bool
+
+
+class TopologyRegistry(MutableMapping):
+    """
+    Catalogue of named topologies indexed for fast identification.
+
+    Behaves like a dictionary from names to Topology objects. Entries are bucketed by cheap invariants (number
+    of points and the sorted profile of minimal neighborhood and up-set sizes), and inside a bucket by their
+    certificate (see :meth:`Topology.get_certificate`), so identifying a topology hashes straight to
+    its homeomorphic entries instead of comparing it with every entry. Entries that are not topologies are
+    only compared, one by one, with collections that are not topologies either.
+
+    Registered topologies should not be modified afterwards, since the index is not updated.
+    """
+
+    def __init__(self, topologies=None):
+        """
+        Initializes the registry, optionally with the entries of a dictionary of named topologies.
+
+        Parameters:
+        topologies (dict, optional): A dictionary with names as keys and Topology objects as values.
+        """
+        self._entries = {}
+        self._buckets = {}  # invariant key -> list of names, in registration order
+        self._certificates = {}  # invariant key -> {certificate: list of names}, built on first lookup
+        if topologies is not None:
+            self.update(topologies)
+
+    def __getitem__(self, name) -> 'Topology':
+        return self._entries[name]
+
+    def __setitem__(self, name, topology: 'Topology'):
+        if not isinstance(topology, Topology):
+            raise TypeError("Only instances of Topology can be registered.")
+        if name in self._entries:
+            del self[name]
+        key = topology._invariant_key()
+        self._entries[name] = topology
+        self._buckets.setdefault(key, []).append(name)
+        self._certificates.pop(key, None)
+
+    def __delitem__(self, name):
+        topology = self._entries.pop(name)
+        key = topology._invariant_key()
+        self._buckets[key].remove(name)
+        if not self._buckets[key]:
+            del self._buckets[key]
+        self._certificates.pop(key, None)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"TopologyRegistry({list(self._entries)})"
+
+    def register(self, name, topology: 'Topology'):
+        """
+        Adds a named topology to the registry, replacing any previous entry with the same name.
+
+        Parameters:
+        name: The name of the topology.
+        topology (Topology): The topology to register.
+        """
+        self[name] = topology
+
+    def identify(self, topology: 'Topology') -> list:
+        """
+        Finds the registered topologies that are homeomorphic to the given one.
+
+        Parameters:
+        topology (Topology): The topology to identify.
+
+        Returns:
+        list: Names of the homeomorphic entries, in registration order.
+        """
+        key = topology._invariant_key()
+        candidates = self._buckets.get(key)
+        if not candidates:
+            return []
+
+        # Collections that are not topologies are compared one by one, only against their bucket
+        if not topology.properties().is_topology:
+            return [name for name in candidates if topology.is_structurally_equal(self._entries[name])]
+
+        # The certificate of an entry that is not a topology describes the topology it generates, so those
+        # entries are left out of the certificate index: they are never homeomorphic to a topology
+        certificates = self._certificates.get(key)
+        if certificates is None:
+            certificates = {}
+            for name in candidates:
+                entry = self._entries[name]
+                if entry.properties().is_topology:
+                    certificates.setdefault(entry.get_certificate(), []).append(name)
+            self._certificates[key] = certificates
+        return list(certificates.get(topology.get_certificate(), []))
 
 
 class Topology:
     """
     Represents a topology on a finite set.
 
+    Internally the points of the space are indexed ``0..n-1`` and every open set is stored as an integer
+    bitmask (bit ``i`` set when the ``i``-th point belongs to the set) in a hashed index. The set based
+    attributes are views built from those masks.
+
+    Topologies created with :meth:`from_basis` or :meth:`from_subbasis` are lazy: they only keep the minimal
+    neighborhoods of the points, answer queries from them, and list the open sets the first time the
+    collection is iterated.
+
     Class Attributes:
-    - known_topologies (dict): Stores known topologies to facilitate identification.
+    - known_topologies (TopologyRegistry): Stores known topologies to facilitate identification.
 
     Instance Attributes:
     - space (set): The space on which the topology is defined.
-    - collection_of_subsets (list): Collection of subsets that form the topology.
+    - collection_of_subsets (tuple): Collection of subsets that form the topology, as frozensets.
     """
-    known_topologies = {}  # Class attribute to store known topologies
+    known_topologies = TopologyRegistry()  # Class attribute to store known topologies
 
     def __init__(self, space, collection_of_subsets):
         """
@@ -22,85 +363,960 @@ class Topology:
         Parameters:
         space (iterable): The set representing the space.
         collection_of_subsets (iterable of iterables): The collection of subsets forming the topology.
+
+        Raises:
+        ValueError: If a subset of the collection contains elements outside the space.
         """
         self.space = set(space)
-        # Ensure uniqueness of subsets
-        unique_subsets = set(frozenset(s) for s in collection_of_subsets)
-        self.collection_of_subsets = [set(s) for s in unique_subsets]
+        self._points = _ordered_points(self.space)
+        self._index = {point: i for i, point in enumerate(self._points)}
+        self._full_mask = (1 << len(self._points)) - 1
+        self._lazy = False
+        # Uniqueness of subsets is given by the hashed index of masks
+        self.collection_of_subsets = collection_of_subsets
+
+    @property
+    def collection_of_subsets(self) -> tuple:
+        """
+        The open sets of the topology as a tuple of frozensets, ordered by size.
+
+        The view is built from the internal masks and cannot be modified in place. The collection is changed
+        with :meth:`add_set` and :meth:`remove_set`, or replaced by assigning a new collection.
+
+        Every access rebuilds the tuple and sorts it, in :math:`O(m \\log m)` for :math:`m` open sets, so a
+        loop indexing ``collection_of_subsets[i]`` by position is quadratic. Keep the tuple in a local
+        variable, and use :meth:`is_open` or :meth:`count_open_sets` when the whole collection is not needed.
+        """
+        return tuple(frozenset(self._to_set(mask)) for mask in self._sorted_open_masks())
+
+    @collection_of_subsets.setter
+    def collection_of_subsets(self, collection_of_subsets):
+        open_masks = set()
+        for subset in collection_of_subsets:
+            mask = self._to_mask(subset)
+            if mask is None:
+                raise ValueError(f"The set {set(subset)} is not a subset of the space {self.space}.")
+            open_masks.add(mask)
+        self._open_masks = open_masks
+        self._lazy = False
+        self._invalidate()
+
+    @classmethod
+    def _from_neighborhood_masks(cls, points: list, neighborhoods: list) -> 'Topology':
+        """
+        Builds the lazy topology with the given minimal neighborhood masks, indexed like ``points``, without
+        validating them. The masks must describe a preorder: ``i`` in ``neighborhoods[i]``, and
+        ``neighborhoods[j]`` contained in ``neighborhoods[i]`` whenever ``j`` is in ``neighborhoods[i]``.
+        """
+        topology = cls.__new__(cls)
+        topology.space = set(points)
+        topology._points = list(points)
+        topology._index = {point: i for i, point in enumerate(topology._points)}
+        topology._full_mask = (1 << len(topology._points)) - 1
+        topology._lazy = True
+        topology._open_masks = None
+        topology._neighborhoods = list(neighborhoods)
+        topology._invalidate()
+        return topology
+
+    @classmethod
+    def generated_by(cls, space, family) -> 'Topology':
+        """
+        Creates the smallest topology on the space that contains every member of a family of subsets.
+
+        The topology generated by a family :math:`\\mathcal{S}` consists of the unions of finite intersections of
+        its members, together with :math:`\\emptyset` and :math:`X`. Instead of closing the family under unions and
+        intersections, the minimal neighborhood of every point is computed directly as the intersection of the
+        members that contain it,
+
+        .. math::
+
+            U_x = X \\cap \\bigcap \\{ S \\in \\mathcal{S} : x \\in S \\}
+
+        in a single pass over the family, and the topology keeps only these sets. Open sets are listed on demand,
+        the first time the collection of subsets is iterated, and sub-families are never enumerated.
+
+        Example:
+            >>> Topology.generated_by({1, 2, 3}, [{1, 2}, {2, 3}]).collection_of_subsets
+            (frozenset(), frozenset({2}), frozenset({1, 2}), frozenset({2, 3}), frozenset({1, 2, 3}))
+
+        Parameters:
+            space (iterable): The set on which the topology is defined.
+            family (iterable of iterables): Subsets of the space that must be open.
+
+        Returns:
+            Topology: The topology generated by the family.
+
+        Raises:
+            ValueError: If a member of the family is not a subset of the space.
+        """
+        space = set(space)
+        points = _ordered_points(space)
+        index = {point: i for i, point in enumerate(points)}
+        full_mask = (1 << len(points)) - 1
+        neighborhoods = [full_mask] * len(points)
+        for subset in family:
+            mask = 0
+            for element in subset:
+                if element not in index:
+                    raise ValueError(f"The set {set(subset)} is not a subset of the space {space}.")
+                mask |= 1 << index[element]
+            for i in _iter_bits(mask):
+                neighborhoods[i] &= mask
+        return cls._from_neighborhood_masks(points, neighborhoods)
+
+    @classmethod
+    def from_subbasis(cls, space, subbasis) -> 'Topology':
+        """
+        Creates the topology generated by a subbasis, without listing its open sets.
+
+        A **subbasis** :math:`\\mathcal{S}` generates the smallest topology containing it: the open sets are the unions
+        of finite intersections of members of :math:`\\mathcal{S}`. See :meth:`generated_by`.
+
+        Parameters:
+            space (iterable): The set on which the topology is defined.
+            subbasis (iterable of iterables): Subsets of the space generating the topology.
+
+        Returns:
+            Topology: The topology generated by the subbasis.
+
+        Raises:
+            ValueError: If a member of the subbasis is not a subset of the space.
+        """
+        return cls.generated_by(space, subbasis)
+
+    @classmethod
+    def from_basis(cls, space, basis) -> 'Topology':
+        """
+        Creates the topology with the given basis, without listing its open sets.
+
+        A collection :math:`\\mathcal{B}` is a **basis** of a topology when every open set is a union of members of
+        :math:`\\mathcal{B}`. In a finite space this happens exactly when :math:`\\mathcal{B}` covers :math:`X` and,
+        for every point, the intersection of the members containing it is itself a member, which is then the
+        minimal neighborhood :math:`U_x`.
+
+        Parameters:
+            space (iterable): The set on which the topology is defined.
+            basis (iterable of iterables): The basis of the topology.
+
+        Returns:
+            Topology: The topology with the given basis.
+
+        Raises:
+            ValueError: If the collection is not a basis of a topology on the space.
+        """
+        basis = [set(subset) for subset in basis]
+        topology = cls.from_subbasis(space, basis)
+        basis_masks = {topology._to_mask(subset) for subset in basis}
+        for point, neighborhood in zip(topology._points, topology._neighborhoods):
+            if neighborhood not in basis_masks:
+                raise ValueError(f"The collection is not a basis: the intersection of the members containing "
+                                 f"{point}, {topology._to_set(neighborhood)}, is not a member.")
+        return topology
+
+    def product(self, *others: 'Topology') -> 'Topology':
+        """
+        Creates the product of this space with other spaces.
+
+        The points of the product are the tuples of points of the factors, and the minimal neighborhood of a
+        tuple is the product of the minimal neighborhoods of its coordinates,
+
+        .. math::
+
+            U_{(x_1, \\dots, x_k)} = U_{x_1} \\times \\dots \\times U_{x_k}
+
+        so the product is built from the neighborhoods of the factors and is lazy: the product of two discrete
+        spaces of 10 points, with :math:`2^{100}` open sets, answers closure, connectivity and separation queries
+        without listing them.
+
+        Parameters:
+            *others (Topology): The other factors.
+
+        Returns:
+            Topology: The product space, on the tuples of points.
+        """
+        factors = (self,) + others
+        for factor in factors:
+            if not isinstance(factor, Topology):
+                raise TypeError("The factors of a product must be instances of Topology.")
+
+        # Tuples are indexed in mixed radix, the last coordinate varying fastest, so the neighborhood of a tuple
+        # is built factor by factor
+        neighborhoods = [1]
+        for factor in factors:
+            size = len(factor._points)
+            neighborhoods = [sum(1 << (prefix * size + i) for prefix in _iter_bits(mask) for i in _iter_bits(last))
+                             for mask in neighborhoods for last in factor._neighborhood_masks()]
+        points = list(product(*(factor._points for factor in factors)))
+        return Topology._from_neighborhood_masks(points, neighborhoods)
+
+    def subspace(self, subset) -> 'Topology':
+        """
+        Creates the subspace topology on a subset of the space.
+
+        The open sets of the subspace are the intersections :math:`U \\cap A` with the open sets of the space, so
+        the minimal neighborhood of a point of :math:`A` is :math:`U_x \\cap A`.
+
+        Parameters:
+            subset (set): The subset of the space.
+
+        Returns:
+            Topology: The subspace, lazy and built from the minimal neighborhoods.
+
+        Raises:
+            ValueError: If the set is not a subset of the space.
+        """
+        mask = self._to_subset_mask(subset)
+        indices = list(_iter_bits(mask))
+        position = {i: k for k, i in enumerate(indices)}
+        neighborhoods = self._neighborhood_masks()
+        subspace_neighborhoods = []
+        for i in indices:
+            restricted = 0
+            for j in _iter_bits(neighborhoods[i] & mask):
+                restricted |= 1 << position[j]
+            subspace_neighborhoods.append(restricted)
+        return Topology._from_neighborhood_masks([self._points[i] for i in indices], subspace_neighborhoods)
+
+    def quotient(self, identification) -> 'Topology':
+        """
+        Creates the quotient space obtained by identifying points.
+
+        A set of classes is open in the quotient when the union of its classes is open in the space. The minimal
+        neighborhood of a class is the smallest saturated open set containing it, reached by alternately taking
+        minimal neighborhoods and whole classes until nothing changes; that is, the specialization preorder of
+        the quotient is the transitive closure of the preorder induced on the classes.
+
+        Parameters:
+            identification (dict, callable or iterable of sets): A map sending each point to the label of its
+                class, as a dictionary or a function, or a partition of the space into classes.
+
+        Returns:
+            Topology: The quotient space. Its points are the labels of the map, or the classes of the partition
+            as frozensets.
+
+        Raises:
+            ValueError: If the partition does not split the space into disjoint non-empty classes.
+        """
+        if isinstance(identification, dict) or callable(identification):
+            label_of = identification.__getitem__ if isinstance(identification, dict) else identification
+            labels = [label_of(point) for point in self._points]
+            classes = _ordered_points(set(labels))
+            class_index = {label: k for k, label in enumerate(classes)}
+            class_of = [class_index[label] for label in labels]
+        else:
+            classes = [frozenset(block) for block in identification]
+            class_of = [None] * len(self._points)
+            for k, block in enumerate(classes):
+                if not block:
+                    raise ValueError("The classes of a partition must be non-empty.")
+                for i in _iter_bits(self._to_subset_mask(block)):
+                    if class_of[i] is not None:
+                        raise ValueError(f"The point {self._points[i]} belongs to more than one class.")
+                    class_of[i] = k
+            if None in class_of:
+                raise ValueError("The classes of the partition must cover the space.")
+
+        # Classes met by the minimal neighborhoods of the points of each class
+        below = [0] * len(classes)
+        for i, neighborhood in enumerate(self._neighborhood_masks()):
+            for j in _iter_bits(neighborhood):
+                below[class_of[i]] |= 1 << class_of[j]
+
+        # Transitive closure, by a search from every class
+        neighborhoods = []
+        for k in range(len(classes)):
+            reached = 1 << k
+            pending = [k]
+            while pending:
+                new = below[pending.pop()] & ~reached
+                reached |= new
+                pending.extend(_iter_bits(new))
+            neighborhoods.append(reached)
+        return Topology._from_neighborhood_masks(classes, neighborhoods)
+
+    def _neighborhoods_of(self, other: 'Topology') -> list:
+        """
+        Returns the minimal neighborhood masks of another topology on the same space, in the indexing of this one.
+
+        Raises:
+            ValueError: If the topologies are not defined on the same space.
+        """
+        if not isinstance(other, Topology):
+            raise TypeError("The other topology must be an instance of Topology.")
+        if other.space != self.space:
+            raise ValueError("Both topologies must be defined on the same space.")
+        other_neighborhoods = other._neighborhood_masks()
+        if other._points == self._points:
+            return other_neighborhoods
+        translated = [0] * len(self._points)
+        for i, point in enumerate(other._points):
+            translated[self._index[point]] = self._to_mask(other._to_set(other_neighborhoods[i]))
+        return translated
+
+    def is_finer_than(self, other: 'Topology') -> bool:
+        """
+        Checks if this topology is finer than (contains) another topology on the same space.
+
+        Every open set of the other topology is open in this one exactly when every minimal neighborhood of this
+        topology is contained in the corresponding one of the other, :math:`U_x \\subseteq U'_x`, which takes
+        :math:`O(n)` mask operations. Equal topologies are finer than each other.
+
+        Parameters:
+            other (Topology): A topology on the same space.
+
+        Returns:
+            bool: True if every open set of ``other`` is open in this topology.
+        """
+        return all(not mine & ~theirs for mine, theirs in zip(self._neighborhood_masks(), self._neighborhoods_of(other)))
+
+    def is_coarser_than(self, other: 'Topology') -> bool:
+        """
+        Checks if this topology is coarser than (contained in) another topology on the same space.
+
+        Parameters:
+            other (Topology): A topology on the same space.
+
+        Returns:
+            bool: True if every open set of this topology is open in ``other``.
+        """
+        return all(not theirs & ~mine for mine, theirs in zip(self._neighborhood_masks(), self._neighborhoods_of(other)))
+
+    def compare(self, other: 'Topology') -> str:
+        """
+        Compares this topology with another topology on the same space in the lattice of topologies.
+
+        Parameters:
+            other (Topology): A topology on the same space.
+
+        Returns:
+            str: ``'equal'``, ``'finer'`` or ``'coarser'`` (this topology with respect to ``other``), or
+            ``'incomparable'``.
+        """
+        finer = self.is_finer_than(other)
+        coarser = self.is_coarser_than(other)
+        if finer and coarser:
+            return "equal"
+        if finer:
+            return "finer"
+        if coarser:
+            return "coarser"
+        return "incomparable"
+
+    def join(self, other: 'Topology') -> 'Topology':
+        """
+        Computes the join of two topologies on the same space, the topology generated by the open sets of both.
+
+        Its minimal neighborhoods are the intersections :math:`U_x \\cap U'_x`.
+
+        Parameters:
+            other (Topology): A topology on the same space.
+
+        Returns:
+            Topology: The coarsest topology finer than both, lazy.
+        """
+        neighborhoods = [mine & theirs for mine, theirs in zip(self._neighborhood_masks(), self._neighborhoods_of(other))]
+        return Topology._from_neighborhood_masks(self._points, neighborhoods)
+
+    def meet(self, other: 'Topology') -> 'Topology':
+        """
+        Computes the meet of two topologies on the same space, the sets that are open in both.
+
+        A set is open in both topologies when it contains :math:`U_y` and :math:`U'_y` for each of its points
+        :math:`y`, so the minimal neighborhood of :math:`x` in the meet is the smallest set containing :math:`x`
+        closed under both, the transitive closure of the union of the two specialization preorders.
+
+        Parameters:
+            other (Topology): A topology on the same space.
+
+        Returns:
+            Topology: The finest topology coarser than both, lazy.
+        """
+        below = [mine | theirs for mine, theirs in zip(self._neighborhood_masks(), self._neighborhoods_of(other))]
+        neighborhoods = []
+        for x in range(len(below)):
+            reached = 1 << x
+            pending = [x]
+            while pending:
+                new = below[pending.pop()] & ~reached
+                reached |= new
+                pending.extend(_iter_bits(new))
+            neighborhoods.append(reached)
+        return Topology._from_neighborhood_masks(self._points, neighborhoods)
+
+    def to_bytes(self, labels: bool = True) -> bytes:
+        """
+        Encodes the topology in a compact binary format.
+
+        The encoding is a varint header with the number of points :math:`n` and a label flag, followed by the
+        minimal neighborhood mask of every point in :math:`\\lceil n/8 \\rceil` little-endian bytes and, when the
+        flag is set, the label table: the ``repr`` of the list of points, preceded by its length. The label table
+        is left out when the points are already ``0..n-1``, so a topology on 8 points takes 9 bytes.
+
+        Parameters:
+            labels (bool): Whether to store the points. Without them, :meth:`from_bytes` returns a topology on
+                :math:`\\{0, \\dots, n-1\\}` in the same order.
+
+        Returns:
+            bytes: The encoding, decoded by :meth:`from_bytes`.
+
+        Raises:
+            ValueError: If the collection of subsets is not a topology, or if labels are requested and the
+                points are not Python literals (numbers, strings, tuples of them, ...).
+        """
+        if not self.properties().is_topology:
+            raise ValueError("Only topologies can be encoded; the collection of subsets is not closed.")
+        n = len(self._points)
+        table = None
+        if labels and self._points != list(range(n)):
+            table = repr(self._points)
+            try:
+                decoded = ast.literal_eval(table)
+            except (ValueError, SyntaxError):
+                decoded = None
+            if decoded != self._points:
+                raise ValueError("The points of the space must be Python literals to be stored as labels.")
+        buffer = bytearray()
+        _write_varint(buffer, n << 1 | (table is not None))
+        width = (n + 7) // 8
+        for mask in self._neighborhood_masks():
+            buffer += mask.to_bytes(width, "little")
+        if table is not None:
+            encoded = table.encode("utf-8")
+            _write_varint(buffer, len(encoded))
+            buffer += encoded
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data) -> 'Topology':
+        """
+        Decodes a topology encoded by :meth:`to_bytes`.
+
+        The result is lazy: only the minimal neighborhoods are decoded, and the open sets are listed on demand.
+
+        Example:
+            >>> topology = Topology({1, 2}, [set(), {1}, {1, 2}])
+            >>> Topology.from_bytes(topology.to_bytes()).collection_of_subsets
+            (frozenset(), frozenset({1}), frozenset({1, 2}))
+            >>> Topology.from_bytes(Topology(set(), [set()]).to_bytes()).count_open_sets()
+            1
+
+        Parameters:
+            data (bytes-like): The encoding, e.g. ``bytes`` or a ``memoryview`` of a larger buffer.
+
+        Returns:
+            Topology: The decoded topology.
+
+        Raises:
+            ValueError: If the data is truncated or does not describe the minimal neighborhoods of a topology.
+        """
+        data = memoryview(data)
+        header, position = _read_varint(data, 0)
+        n, has_labels = header >> 1, header & 1
+        width = (n + 7) // 8
+        end = position + n * width
+        if end > len(data):
+            raise ValueError("Truncated topology encoding.")
+        neighborhoods = [int.from_bytes(data[position + x * width:position + (x + 1) * width], "little")
+                         for x in range(n)]
+        points = list(range(n))
+        if has_labels:
+            length, position = _read_varint(data, end)
+            end = position + length
+            if end > len(data):
+                raise ValueError("Truncated topology encoding.")
+            try:
+                points = ast.literal_eval(str(data[position:end], "utf-8"))
+            except (ValueError, SyntaxError, UnicodeDecodeError):
+                raise ValueError("Invalid label table in topology encoding.") from None
+            if not isinstance(points, list) or len(points) != n:
+                raise ValueError("Invalid label table in topology encoding.")
+            try:
+                distinct = len(set(points))
+            except TypeError:
+                raise ValueError("Invalid label table in topology encoding: the labels must be hashable.") from None
+            if distinct != n:
+                raise ValueError("Invalid label table in topology encoding: the labels must be distinct.")
+        if end != len(data):
+            raise ValueError("Unexpected trailing data in topology encoding.")
+
+        # The masks must be the minimal neighborhoods of a preorder
+        for x, mask in enumerate(neighborhoods):
+            if not (mask >> x) & 1 or mask >> n:
+                raise ValueError(f"Invalid neighborhood mask for point {x}.")
+            for y in _iter_bits(mask):
+                if neighborhoods[y] & ~mask:
+                    raise ValueError(f"Neighborhood masks are not transitive at points {x} and {y}.")
+        return cls._from_neighborhood_masks(points, neighborhoods)
+
+    def _invalidate(self):
+        """
+        Drops the cached indexes derived from the open sets. Called whenever the collection is modified.
+        """
+        if not self._lazy:
+            self._neighborhoods = None
+        self._up_sets = None
+        self._canonical_form = None
+        self._neighborhood_array = None
+        self._properties = None
+
+    def _open_mask_set(self) -> set:
+        """
+        Returns the set of open masks, listing them from the minimal neighborhoods the first time for lazy
+        topologies.
+        """
+        if self._open_masks is None:
+            self._open_masks = set(_iter_down_sets(self._neighborhoods, self._up_set_masks(), self._full_mask))
+            if instrumentation.active:
+                instrumentation.count("open_sets_listed", len(self._open_masks))
+        return self._open_masks
+
+    def _is_open_mask(self, mask: int) -> bool:
+        """
+        Checks if a mask is open: a hash lookup once the open sets are listed, otherwise checks that the mask
+        contains the minimal neighborhood of each of its points.
+        """
+        if instrumentation.active:
+            instrumentation.count("open_set_lookups")
+        if self._open_masks is not None:
+            return mask in self._open_masks
+        neighborhoods = self._neighborhoods
+        return all(not neighborhoods[i] & ~mask for i in _iter_bits(mask))
+
+    def count_open_sets(self) -> int:
+        """
+        Returns the number of open sets.
+
+        Lazy topologies count them from the minimal neighborhoods without listing them, so the count is available
+        even when it is astronomically large.
+
+        Returns:
+        int: Number of open sets.
+        """
+        if self._open_masks is not None:
+            return len(self._open_masks)
+        return _count_down_sets(self._neighborhoods, self._up_set_masks(), self._full_mask)
+
+    @property
+    def points(self) -> tuple:
+        """
+        The points of the space in index order: the ``i``-th point corresponds to bit ``i`` of the masks.
+        """
+        return tuple(self._points)
+
+    def _to_mask(self, subset) -> Optional[int]:
+        """
+        Encodes a subset of the space as a bitmask.
+
+        Returns:
+        int or None: The mask of the subset, or None if the subset has elements outside the space.
+        """
+        if instrumentation.active:
+            instrumentation.count("set_conversions")
+        index = self._index
+        mask = 0
+        for element in subset:
+            i = index.get(element)
+            if i is None:
+                return None
+            mask |= 1 << i
+        return mask
+
+    def _to_subset_mask(self, subset) -> int:
+        """
+        Encodes a subset of the space as a bitmask, raising ValueError if it is not a subset of the space.
+        """
+        mask = self._to_mask(subset)
+        if mask is None:
+            raise ValueError(f"The set {subset} is not a subset of the space {self.space}.")
+        return mask
+
+    def _to_set(self, mask: int) -> set:
+        """
+        Decodes a bitmask into the subset of the space it represents.
+        """
+        if instrumentation.active:
+            instrumentation.count("set_conversions")
+        points = self._points
+        return {points[i] for i in _iter_bits(mask)}
+
+    def _sorted_open_masks(self) -> list:
+        """
+        Returns the masks of the open sets ordered by size and then by mask value.
+        """
+        return sorted(self._open_mask_set(), key=lambda mask: (_popcount(mask), mask))
+
+    def _neighborhood_masks(self) -> list:
+        """
+        Returns the cached list of minimal neighborhood masks, indexed like the points.
+
+        The minimal neighborhood :math:`U_x` is the intersection of the members of the collection that contain
+        :math:`x`. All of them are computed in a single pass over the open sets.
+        """
+        if self._neighborhoods is None:
+            if instrumentation.active:
+                instrumentation.count("collection_scans")
+            neighborhoods = [self._full_mask] * len(self._points)
+            for mask in self._open_mask_set():
+                for i in _iter_bits(mask):
+                    neighborhoods[i] &= mask
+            self._neighborhoods = neighborhoods
+        return self._neighborhoods
+
+    def _up_set_masks(self) -> list:
+        """
+        Returns the cached list of up-set masks: bit ``j`` of entry ``i`` is set when point ``i`` belongs to
+        :math:`U_j`.
+        """
+        if self._up_sets is None:
+            up_sets = [0] * len(self._points)
+            for j, neighborhood in enumerate(self._neighborhood_masks()):
+                for i in _iter_bits(neighborhood):
+                    up_sets[i] |= 1 << j
+            self._up_sets = up_sets
+        return self._up_sets
+
+    def get_minimal_neighborhood(self, point) -> set:
+        """
+        Returns the minimal open neighborhood of a point.
+
+        In a finite space every point :math:`x` has a smallest open set containing it, the intersection of all
+        the open sets that contain :math:`x`:
+
+        .. math::
+
+            U_x = \\bigcap \\{ U \\in \\tau : x \\in U \\}
+
+        The sets :math:`U_x` determine the topology: the open sets are exactly the unions of them. Closures,
+        interiors and the separation axioms are computed from this index, so they describe the topology
+        generated by the collection, which is the collection itself when it is a topology.
+
+        Parameters:
+            point: A point of the space.
+
+        Returns:
+            set: The minimal open neighborhood of the point.
+        """
+        return self._to_set(self._neighborhood_masks()[self._index[point]])
+
+    def get_minimal_neighborhoods(self) -> dict:
+        """
+        Returns the minimal open neighborhood of every point of the space.
+
+        Returns:
+            dict: A dictionary mapping each point to its minimal open neighborhood.
+        """
+        return {point: self._to_set(mask) for point, mask in zip(self._points, self._neighborhood_masks())}
+
+    def get_down_set(self, point) -> set:
+        """
+        Returns the down-set of a point in the specialization preorder.
+
+        The **specialization preorder** of a finite space is defined by :math:`x \\leq y` if and only if
+        :math:`U_x \\subseteq U_y`, or equivalently :math:`x \\in U_y`. Open sets are the down-sets of this
+        preorder and closed sets are its up-sets, so the down-set of a point is its minimal neighborhood.
+
+        .. math::
+
+            \\downarrow x = \\{ y \\in X : y \\leq x \\} = U_x
+
+        Parameters:
+            point: A point of the space.
+
+        Returns:
+            set: The points below the given point.
+        """
+        return self.get_minimal_neighborhood(point)
+
+    def get_up_set(self, point) -> set:
+        """
+        Returns the up-set of a point in the specialization preorder, which is the closure of the point.
+
+        .. math::
+
+            \\uparrow x = \\{ y \\in X : x \\leq y \\} = \\overline{\\{x\\}}
+
+        Parameters:
+            point: A point of the space.
+
+        Returns:
+            set: The points above the given point.
+        """
+        return self._to_set(self._up_set_masks()[self._index[point]])
+
+    def get_specialization_matrix(self) -> list:
+        """
+        Returns the matrix of the specialization preorder.
+
+        Rows and columns follow the order of :attr:`points`; entry ``[i][j]`` is True when
+        ``points[i]`` :math:`\\leq` ``points[j]``, that is, when ``points[i]`` belongs to the minimal
+        neighborhood of ``points[j]``.
+
+        Returns:
+            list[list[bool]]: The :math:`n \\times n` preorder matrix.
+        """
+        n = len(self._points)
+        return [[bool((up_set >> j) & 1) for j in range(n)] for up_set in self._up_set_masks()]
 
     def is_topology(self) -> bool:
         """
         Checks if the collection of subsets forms a topology on the given space.
 
+        The check runs in :math:`O(m \\cdot n)` mask operations, see :meth:`find_topology_violation`.
+
         Returns:
         bool: True if the collection is a topology, False otherwise.
         """
-        # Check if the empty set and the entire space are in the collection
-        if set() not in self.collection_of_subsets:
-            print("The empty set is not in the collection.")
-            return False
-        if self.space not in self.collection_of_subsets:
-            print("The entire space is not in the collection.")
-            return False
+        if self.properties().is_topology:
+            return True
+        if diagnostics.enabled():
+            violation = self.find_topology_violation()
+            diagnostics.report("not_topology", violation.message, violation=violation)
+        return False
 
-        n = len(self.collection_of_subsets)
+    def properties(self) -> TopologyProperties:
+        """
+        Computes the profile of properties reported by the ``is_*`` methods and by ``repr``.
 
-        # Check if arbitrary unions of elements are in the collection
-        for i in range(1, 2 ** n):
-            union = set()
-            for j in range(n):
-                if (i >> j) & 1:
-                    union = union.union(self.collection_of_subsets[j])
-            if union not in self.collection_of_subsets:
-                print(f"The union {union} is not in the collection.")
-                return False
+        All of them are derived from the minimal neighborhoods in a single pass: the space is discrete, T1 and
+        Hausdorff exactly when every :math:`U_x` is a singleton, T0 when the :math:`U_x` are distinct, and
+        connected when the comparability graph has one component. The profile is cached and discarded when the
+        collection is modified.
 
-        # Check if finite intersections of elements are in the collection
-        for i in range(1, 2 ** n):
-            indices = [j for j in range(n) if (i >> j) & 1]
-            if len(indices) <= 1:
-                continue  # The intersection of a single set is the set itself
-            intersection = self.collection_of_subsets[indices[0]]
-            for idx in indices[1:]:
-                intersection = intersection.intersection(self.collection_of_subsets[idx])
-            if intersection not in self.collection_of_subsets:
-                print(f"The intersection {intersection} is not in the collection.")
-                return False
+        Returns:
+            TopologyProperties: The properties of the collection.
+        """
+        if self._properties is None:
+            self._properties = self._compute_properties(self.find_topology_violation() is None)
+        return self._properties
 
-        return True
+    def _compute_properties(self, is_topology: bool) -> TopologyProperties:
+        """
+        Builds the property profile from the minimal neighborhoods, given whether the collection is a topology.
+        """
+        neighborhoods = self._neighborhood_masks()
+        singletons = all(neighborhood == 1 << i for i, neighborhood in enumerate(neighborhoods))
+        if self._open_masks is None:
+            # Lazy topology: the only non empty open set is X when every minimal neighborhood is X
+            indiscrete = bool(self._points) and all(mask == self._full_mask for mask in neighborhoods)
+        else:
+            open_masks = self._open_masks
+            indiscrete = len(open_masks) == 2 and 0 in open_masks and self._full_mask in open_masks
+        return TopologyProperties(
+            is_topology=is_topology,
+            discrete=is_topology and singletons,
+            indiscrete=indiscrete,
+            T0=len(set(neighborhoods)) == len(neighborhoods),
+            T1=singletons,
+            hausdorff=singletons,
+            connected=len(self.connected_components()) <= 1,
+            compact=True,
+            separable=True,
+        )
+
+    def find_topology_violation(self) -> Optional['TopologyViolation']:
+        """
+        Looks for a witness that the collection of subsets is not a topology.
+
+        For a finite collection :math:`\\tau` containing :math:`\\emptyset` and :math:`X`, let :math:`U_x` be the
+        intersection of the members of :math:`\\tau` that contain :math:`x`. Then :math:`\\tau` is a topology if and
+        only if every :math:`U_x` belongs to :math:`\\tau` and :math:`A \\cup U_x \\in \\tau` for every :math:`A \\in \\tau`:
+        every union of members is a union of sets :math:`U_x`, and so is every intersection. This restricts the
+        pairwise union and intersection checks to :math:`O(m \\cdot n)` pairs, where :math:`m` is the number of
+        subsets and :math:`n` the number of points, instead of enumerating the :math:`2^m` sub-collections.
 
-    def add_set(self, new_set) -> bool:
+        Returns:
+        TopologyViolation or None: The first violation found, or None if the collection is a topology.
+        """
+        if self._lazy:
+            # Lazy topologies are generated from their minimal neighborhoods
+            return None
+        open_masks = self._open_masks
+
+        # Check if the empty set and the entire space are in the collection
+        if 0 not in open_masks:
+            return TopologyViolation("empty_set", None, set())
+        if self._full_mask not in open_masks:
+            return TopologyViolation("space", None, set(self.space))
+
+        # Minimal neighborhood of every point: the intersection of the members that contain it
+        neighborhoods = self._neighborhood_masks()
+
+        # Closure under intersections: every minimal neighborhood must be in the collection. When one is
+        # missing, intersect the members containing the point one by one to find the failing pair.
+        for i, neighborhood in enumerate(neighborhoods):
+            if neighborhood in open_masks:
+                continue
+            bit = 1 << i
+            running = self._full_mask
+            for mask in open_masks:
+                if not mask & bit:
+                    continue
+                intersection = running & mask
+                if intersection not in open_masks:
+                    return TopologyViolation("intersection", (self._to_set(running), self._to_set(mask)),
+                                             self._to_set(intersection))
+                running = intersection
+
+        # Closure under unions: adding any minimal neighborhood to a member must stay in the collection
+        distinct_neighborhoods = sorted(set(neighborhoods))
+        if instrumentation.active:
+            instrumentation.count("collection_scans")
+        for mask in self._sorted_open_masks():
+            for neighborhood in distinct_neighborhoods:
+                union = mask | neighborhood
+                if union not in open_masks:
+                    return TopologyViolation("union", (self._to_set(mask), self._to_set(neighborhood)),
+                                             self._to_set(union))
+
+        return None
+
+    def add_set(self, new_set, close: bool = False) -> bool:
         """
         Adds a new set to the collection of subsets.
 
+        The indexes are updated in place instead of being rebuilt. Adding :math:`S` only shrinks the minimal
+        neighborhoods of the points of :math:`S`, :math:`U_x \\mapsto U_x \\cap S`, and when the collection was a
+        topology it is still one exactly when the unions and intersections of :math:`S` with the existing open
+        sets are in it, which takes a single pass over the collection.
+
+        With ``close=True`` the collection is repaired instead: the unions and intersections generated by the new
+        set are added with a worklist until the collection is the topology generated by the old collection and
+        :math:`S`. Lazy topologies only update their minimal neighborhoods. A collection that was not a topology
+        is closed even if it already contains the set.
+
         Parameters:
         new_set (iterable): The new set to be added to the collection.
+        close (bool): Whether to add the sets needed to keep the collection a topology.
 
         Returns:
         bool: True if the new set is added successfully and the collection remains a topology, False otherwise.
         """
         new_set = set(new_set)
-        if not new_set.issubset(self.space):
-            print(f"The set {new_set} is not a subset of the space {self.space}. Cannot add.")
+        mask = self._to_mask(new_set)
+        if mask is None:
+            if diagnostics.enabled():
+                diagnostics.report("set_rejected", f"The set {new_set} is not a subset of the space {self.space}. "
+                                                   f"Cannot add.", subset=new_set)
             return False
 
-        if new_set not in self.collection_of_subsets:
-            self.collection_of_subsets.append(new_set)
-            print(f"Added the set {new_set} to the collection.")
-            if self.is_open(new_set):
-                print(f"The set {new_set} is open.")
-            if self.is_closed(new_set):
-                print(f"The set {new_set} is closed.")
+        was_topology = self.properties().is_topology
+        if self._is_open_mask(mask) and (was_topology or not close):
+            is_topology = was_topology
+            if diagnostics.enabled():
+                diagnostics.report("set_present", f"The set {new_set} is already in the collection.", subset=new_set)
         else:
-            print(f"The set {new_set} is already in the collection.")
+            if close and self._lazy:
+                # The open sets are listed again from the updated neighborhoods when needed
+                self._open_masks = None
+                is_topology = True
+            elif close:
+                self._close_with(mask, was_topology)
+                is_topology = True
+            else:
+                open_masks = self._open_mask_set()
+                self._lazy = False
+                open_masks.add(mask)
+                if was_topology:
+                    if instrumentation.active:
+                        instrumentation.count("collection_scans")
+                    is_topology = all(open_mask | mask in open_masks and open_mask & mask in open_masks
+                                      for open_mask in open_masks)
+                else:
+                    is_topology = None
+            self._restrict_neighborhoods(mask)
+            if is_topology is None:
+                # The collection was not a topology, adding a set may have repaired it
+                is_topology = self.find_topology_violation() is None
+            self._properties = self._compute_properties(is_topology)
+            if diagnostics.enabled():
+                diagnostics.report("set_added", f"Added the set {new_set} to the collection.", subset=new_set)
+                # Report the messages the public predicates would print, without calling them
+                if self._is_open_mask(mask):
+                    diagnostics.report("set_open", f"The set {new_set} is open.", subset=new_set)
+                else:
+                    diagnostics.report("not_open", f"The set {sorted(new_set)} is not open.", subset=new_set)
+                if self._is_open_mask(self._full_mask ^ mask):
+                    diagnostics.report("set_closed", f"The set {new_set} is closed.", subset=new_set)
+                else:
+                    diagnostics.report("not_closed", f"The set {sorted(new_set)} is not closed.", subset=new_set)
 
         # Verify if the collection is still a topology
-        if self.is_topology():
-            print("After adding, the collection is still a topology.")
+        if is_topology:
+            if diagnostics.enabled():
+                diagnostics.report("still_topology", "After adding, the collection is still a topology.")
             return True
         else:
-            print("After adding, the collection is no longer a topology.")
+            if diagnostics.enabled():
+                violation = self.find_topology_violation()
+                diagnostics.report("not_topology", violation.message, violation=violation)
+                diagnostics.report("not_topology_after_add", "After adding, the collection is no longer a topology.")
+            return False
+
+    def remove_set(self, subset) -> bool:
+        """
+        Removes a set from the collection of subsets.
+
+        The minimal neighborhoods and the property profile are rebuilt from the remaining sets. Lazy topologies
+        list their open sets first.
+
+        Parameters:
+        subset (iterable): The set to be removed from the collection.
+
+        Returns:
+        bool: True if the set was in the collection and has been removed, False otherwise.
+        """
+        subset = set(subset)
+        mask = self._to_mask(subset)
+        open_masks = self._open_mask_set()
+        if mask is None or mask not in open_masks:
+            if diagnostics.enabled():
+                diagnostics.report("set_not_found", f"The set {subset} is not in the collection. Cannot remove.",
+                                   subset=subset)
             return False
+        open_masks.discard(mask)
+        self._lazy = False
+        self._invalidate()
+        if diagnostics.enabled():
+            diagnostics.report("set_removed", f"Removed the set {subset} from the collection.", subset=subset)
+        return True
+
+    def _close_with(self, mask: int, closed: bool):
+        """
+        Adds a mask to the listed open sets together with every union and intersection it generates, so the
+        collection becomes the topology it generates. When the collection was not ``closed`` already, its own
+        members are combined as well.
+        """
+        open_masks = self._open_masks
+        worklist = [candidate for candidate in (0, self._full_mask, mask) if candidate not in open_masks]
+        open_masks.update(worklist)
+        if not closed:
+            worklist = list(open_masks)
+        while worklist:
+            new_mask = worklist.pop()
+            for open_mask in list(open_masks):
+                for generated in (open_mask | new_mask, open_mask & new_mask):
+                    if generated not in open_masks:
+                        open_masks.add(generated)
+                        worklist.append(generated)
+
+    def _restrict_neighborhoods(self, mask: int):
+        """
+        Updates the cached indexes after adding a set: the minimal neighborhoods of its points are intersected
+        with it and the up-sets lose the corresponding points. Unions and intersections of members leave the
+        minimal neighborhoods unchanged, so this also holds after closing the collection.
+        """
+        neighborhoods = self._neighborhood_masks()
+        up_sets = self._up_sets
+        for x in _iter_bits(mask):
+            removed = neighborhoods[x] & ~mask
+            if removed:
+                neighborhoods[x] &= mask
+                if up_sets is not None:
+                    for y in _iter_bits(removed):
+                        up_sets[y] &= ~(1 << x)
+        self._canonical_form = None
+        self._neighborhood_array = None
 
     def get_ordered_subsets(self) -> list:
         """
@@ -113,13 +1329,8 @@ class Topology:
         space_set = self.space
         empty_set = set()
 
-        subsets = self.collection_of_subsets.copy()
-
-        # Remove the entire space and the empty set from the temporary list
-        subsets = [s for s in subsets if s != space_set and s != empty_set]
-
-        # Sort the subsets by size (ascending order)
-        subsets.sort(key=lambda s: len(s))
+        # Remove the entire space and the empty set, the remaining masks come sorted by size (ascending order)
+        subsets = [self._to_set(mask) for mask in self._sorted_open_masks() if mask and mask != self._full_mask]
 
         # Create the ordered list: first the space, then the empty set, then the subsets ordered by size
         ordered_subsets = [space_set, empty_set] + subsets
@@ -130,7 +1341,8 @@ class Topology:
         """
         Returns a string representation of the Topology instance, including its properties.
         """
-        id_str = "Topology" if self.is_topology() else "Set"
+        profile = self.properties()
+        id_str = "Topology" if profile.is_topology else "Set"
         ordered_subsets = self.get_ordered_subsets()
 
         # Build the string representation of the subsets
@@ -139,23 +1351,23 @@ class Topology:
         # Check properties
         properties = []
 
-        if self.is_discrete():
+        if profile.discrete:
             properties.append("Discrete")
-        if self.is_indiscrete():
+        if profile.indiscrete:
             properties.append("Indiscrete")
-        if self.is_T0():
+        if profile.T0:
             properties.append("T0")
-        if self.is_T1():
+        if profile.T1:
             properties.append("T1")
-        if self.is_hausdorff():
+        if profile.hausdorff:
             properties.append("T2 (Hausdorff)")
-        if self.is_connected():
+        if profile.connected:
             properties.append("Connected")
         else:
             properties.append("Not Connected")
-        if self.is_compact():
+        if profile.compact:
             properties.append("Compact")
-        if self.is_separable():
+        if profile.separable:
             properties.append("Separable")
 
         # Build properties string
@@ -171,10 +1383,32 @@ class Topology:
         """
         Returns the number of subsets in the collection.
 
+        ``len()`` is limited to ``sys.maxsize``, while a lazy topology can have far more open sets (a discrete
+        space on 64 points has :math:`2^{64}`). Use :meth:`count_open_sets`, which has no limit, for such spaces.
+
         Returns:
         int: Number of subsets.
+
+        Raises:
+        OverflowError: If the number of subsets exceeds ``sys.maxsize``.
         """
-        return len(self.collection_of_subsets)
+        count = self.count_open_sets()
+        if count > sys.maxsize:
+            raise OverflowError(f"The topology has {count} open sets, too many for len(); "
+                                f"use count_open_sets() instead.")
+        return count
+
+    def __bool__(self) -> bool:
+        """
+        Returns True: a topology is always truthy.
+
+        Without it truth tests would fall back to ``len()``, counting the open sets of lazy topologies and
+        raising OverflowError when there are too many.
+
+        Returns:
+        bool: True.
+        """
+        return True
 
     def __eq__(self, other) -> bool:
         """
@@ -192,6 +1426,9 @@ class Topology:
         """
         Checks if two topologies have the same structure, regardless of the elements.
 
+        When both collections are topologies their certificates (see :meth:`get_certificate`) are compared.
+        Collections that are not topologies are compared by trying every bijection between the spaces.
+
         Parameters:
         other (Topology): Another topology to compare.
 
@@ -201,48 +1438,155 @@ class Topology:
         if not isinstance(other, Topology):
             return False
 
-        # Check if the sizes of the spaces are equal
-        if len(self.space) != len(other.space):
+        # Check the number of points and the sizes of the minimal neighborhoods and up-sets
+        if self._invariant_key() != other._invariant_key():
             return False
 
-        # Check if the number of subsets is equal
-        if len(self.collection_of_subsets) != len(other.collection_of_subsets):
-            return False
+        if self.properties().is_topology and other.properties().is_topology:
+            return self.get_certificate() == other.get_certificate()
 
-        # Map elements to indices
-        self_elements = list(self.space)
-        other_elements = list(other.space)
+        # Generate all possible bijections between the two spaces, as permutations of the point indices
+        return self._find_collection_bijection(other) is not None
 
-        # Generate all possible bijections between the two spaces
-        for perm in permutations(other_elements):
-            mapping = dict(zip(self_elements, perm))
+    def get_certificate(self) -> tuple:
+        """
+        Returns a certificate of the homeomorphism class of the topology.
 
-            # Apply mapping to all subsets in self.collection_of_subsets
-            mapped_subsets = [set(mapping[e] for e in subset) for subset in self.collection_of_subsets]
+        The certificate is computed from a canonical labelling of the specialization preorder: the points are
+        first split into classes by invariants (minimal neighborhood size, up-set and down-set sizes) refined
+        until stable, and a backtracking search over the refined classes, pruned by the automorphisms it finds,
+        picks the labelling with the smallest encoding. Two topologies are homeomorphic if and only if their
+        certificates are equal, so the certificate can be used as a dictionary key to bucket homeomorphism
+        classes. It describes the topology generated by the collection of subsets.
 
-            # Compare the mapped subsets with the collection of subsets of the other
-            if set(frozenset(s) for s in mapped_subsets) == set(frozenset(s) for s in other.collection_of_subsets):
-                return True
+        Returns:
+            tuple: A hashable certificate, the tuple of minimal neighborhood masks under the canonical labelling.
+        """
+        return self._canonical().certificate
 
-        return False
+    def _canonical(self) -> CanonicalForm:
+        """
+        Returns the cached canonical form of the specialization preorder.
+        """
+        if self._canonical_form is None:
+            self._canonical_form = canonical_form(self._neighborhood_masks(), self._up_set_masks())
+        return self._canonical_form
+
+    def find_homeomorphism(self, other: 'Topology'):
+        """
+        Finds a homeomorphism from this space onto another one.
+
+        When both collections are topologies, each point is sent to the point of the other space with the same
+        canonical label (see :meth:`get_certificate`). The canonical labellings come from a backtracking search
+        over the refined classes of points, and equal certificates mean that the labellings carry the minimal
+        neighborhoods of one space exactly onto those of the other. Collections that are not topologies are
+        matched by trying every bijection between the spaces.
+
+        Example:
+            >>> a = Topology({1, 2}, [set(), {1}, {1, 2}])
+            >>> b = Topology({'x', 'y'}, [set(), {'y'}, {'x', 'y'}])
+            >>> a.find_homeomorphism(b).mapping
+            {1: 'y', 2: 'x'}
+
+        Parameters:
+            other (Topology): The space to map onto.
+
+        Returns:
+            Function or None: A homeomorphism from this space onto ``other``, or None if they are not homeomorphic.
+        """
+        from .functions import Function
+
+        if not isinstance(other, Topology) or self._invariant_key() != other._invariant_key():
+            return None
+
+        if self.properties().is_topology and other.properties().is_topology:
+            form, other_form = self._canonical(), other._canonical()
+            if form.certificate != other_form.certificate:
+                return None
+            point_by_label = [None] * len(other._points)
+            for point, label in zip(other._points, other_form.labelling):
+                point_by_label[label] = point
+            mapping = {point: point_by_label[label] for point, label in zip(self._points, form.labelling)}
+            return Function(self, other, mapping)
+
+        permutation = self._find_collection_bijection(other)
+        if permutation is None:
+            return None
+        return Function(self, other, {point: other._points[permutation[i]] for i, point in enumerate(self._points)})
+
+    def _find_collection_bijection(self, other: 'Topology') -> Optional[tuple]:
+        """
+        Returns a permutation of the point indices that carries this collection onto the other one, trying every
+        bijection, or None if there is none. Both collections must have the same number of points.
+        """
+        self_masks = list(self._open_mask_set())
+        other_masks = other._open_mask_set()
+        if len(self_masks) != len(other_masks):
+            return None
+
+        # Relabelling is injective and both collections have the same size, so it is enough to check that
+        # every relabelled mask is in the other collection.
+        tried = 0
+        for tried, perm in enumerate(permutations(range(len(self._points))), 1):
+            if all(_permute_mask(mask, perm) in other_masks for mask in self_masks):
+                break
+        else:
+            perm = None
+        if instrumentation.active:
+            instrumentation.count("collection_scans")
+            instrumentation.count("permutations_tried", tried)
+        return perm
 
-    def identify_topology(self, known_topologies) -> list:
+    def get_automorphism_group(self) -> AutomorphismGroup:
+        """
+        Computes the automorphism group of the space, the homeomorphisms of the space onto itself.
+
+        The automorphisms are the permutations of the points that preserve the specialization preorder. They are
+        found by the canonical labelling search (see :meth:`get_certificate`), which refines the classes of points
+        and prunes subtrees equivalent under the automorphisms found so far, as graph automorphism tools do. The
+        generators it collects generate the whole group, and the order is obtained from the orbit sizes along its
+        first branch, so the :math:`n!` permutations are never listed. It describes the topology generated by
+        the collection of subsets.
+
+        Returns:
+            AutomorphismGroup: Generators, order and orbits of the automorphism group.
+        """
+        form = self._canonical()
+        points = self._points
+        generators = [{points[i]: points[j] for i, j in enumerate(generator)} for generator in form.generators]
+        point_orbits = {}
+        for point, root in zip(points, orbits(len(points), form.generators)):
+            point_orbits.setdefault(root, set()).add(point)
+        return AutomorphismGroup(generators, form.group_order, [point_orbits[root] for root in sorted(point_orbits)])
+
+    def _invariant_key(self) -> tuple:
+        """
+        Returns cheap invariants of the homeomorphism class, linear in the number of points: the number of points
+        and the sorted pairs of sizes of the minimal neighborhoods and up-sets, the degrees used by
+        :func:`~finite_topology.canonical.initial_colouring`.
+        """
+        degrees = sorted(zip(map(_popcount, self._neighborhood_masks()), map(_popcount, self._up_set_masks())))
+        return len(self._points), tuple(degrees)
+
+    def identify_topology(self, known_topologies=None) -> list:
         """
         Identifies the topology by comparing it to a list of known topologies.
 
         Parameters:
-        known_topologies (dict): A dictionary with names as keys and Topology objects as values.
+        known_topologies (dict or TopologyRegistry, optional): A dictionary with names as keys and Topology
+            objects as values. Defaults to the class registry ``Topology.known_topologies``. Plain dictionaries
+            are indexed on each call; keep a TopologyRegistry to reuse the index across calls.
 
         Returns:
         list: Names of known topologies that are homeomorphic to this topology.
         """
-        matches = []
-        for name, known_topo in known_topologies.items():
-            if self.is_structurally_equal(known_topo):
-                matches.append(name)
-        return matches
+        if known_topologies is None:
+            known_topologies = Topology.known_topologies
+        if not isinstance(known_topologies, TopologyRegistry):
+            known_topologies = TopologyRegistry(known_topologies)
+        return known_topologies.identify(self)
 
-    def get_basis(self) -> list:
+    def get_basis(self, sub_collection=None) -> list:
         """
         Computes and returns a basis for the topology.
 
@@ -252,31 +1596,45 @@ class Topology:
 
             \\forall U \\in \\tau, \\quad \\exists \\{ B_i \\}_{i \\in I} \\subseteq \\mathcal{B}, \\quad U = \\bigcup_{i \\in I} B_i
 
-        Returns:
-            list[set]: A list of sets representing the basis of the topology.
-        """
-        basis = []
+        A finite topology has a unique minimal basis, the distinct minimal neighborhoods :math:`U_x`: every open set
+        is the union of the :math:`U_x` of its points, and :math:`U_x` is not a union of open sets not containing
+        :math:`x`. It is read from the neighborhood index without looking at the other open sets.
 
-        # Exclude the empty set if desired, as it is usually not included in the basis
-        open_sets = [s for s in self.collection_of_subsets if s]
+        When a sub-collection of open sets is given, the members that are not the union of the members strictly
+        contained in them are returned instead. They are the smallest part of the sub-collection with the same
+        unions, so they form a basis whenever the sub-collection is one.
 
-        for open_set in open_sets:
-            # Check if open_set can be expressed as a union of other open sets
-            can_be_formed = False
-            for i in range(1, len(open_sets) + 1):
-                for subsets in combinations(open_sets, i):
-                    if open_set in subsets:
-                        continue  # Skip if open_set is in the combination
-                    union_subsets = set().union(*subsets)
-                    if union_subsets == open_set:
-                        can_be_formed = True
-                        break
-                if can_be_formed:
-                    break
-            if not can_be_formed:
-                basis.append(open_set)
+        Parameters:
+            sub_collection (iterable of iterables, optional): Open sets to extract the basis from.
 
-        return basis
+        Returns:
+            list[set]: A list of sets representing the basis, ordered by size.
+
+        Raises:
+            ValueError: If a member of the sub-collection is not an open set.
+        """
+        if sub_collection is None:
+            masks = set(self._neighborhood_masks())
+        else:
+            candidates = set()
+            for subset in sub_collection:
+                mask = self._to_subset_mask(subset)
+                if not self._is_open_mask(mask):
+                    raise ValueError(f"The set {set(subset)} is not open.")
+                if mask:
+                    candidates.add(mask)
+
+            # A member is redundant when the members strictly inside it cover it
+            masks = set()
+            for mask in candidates:
+                covered = 0
+                for other in candidates:
+                    if other != mask and not other & ~mask:
+                        covered |= other
+                if covered != mask:
+                    masks.add(mask)
+
+        return [self._to_set(mask) for mask in sorted(masks, key=lambda mask: (_popcount(mask), mask))]
 
     def is_discrete(self) -> bool:
         """
@@ -296,15 +1654,9 @@ class Topology:
         if not self.is_topology():
             return False
 
-        # Generate the power set of the space (all possible subsets)
-        all_subsets = [set(s) for s in chain.from_iterable(combinations(self.space, r) for r in range(len(self.space) + 1))]
-
-        # Convert both to sets of frozensets for precise comparison
-        power_set = set(frozenset(s) for s in all_subsets)
-        topology_set = set(frozenset(s) for s in self.collection_of_subsets)
-
-        # Check if the collection of subsets matches the power set
-        return topology_set == power_set
+        # The topology is the power set exactly when every point is open, that is, when every minimal
+        # neighborhood is a singleton
+        return self.properties().discrete
 
     def is_indiscrete(self):
         """
@@ -315,10 +1667,29 @@ class Topology:
         Returns:
             bool: True if the topology is indiscrete, False otherwise.
         """
-        if len(self.collection_of_subsets) == 2 and set() in self.collection_of_subsets and self.space in self.collection_of_subsets:
-            return True
-        else:
-            return False
+        return self.properties().indiscrete
+
+    def connected_components(self) -> list:
+        """
+        Computes the connected components of the space.
+
+        In a finite space the open sets containing a point :math:`y` all contain :math:`U_y`, so a clopen set
+        containing :math:`y` contains every point comparable to :math:`y` in the specialization preorder. The
+        components are therefore the connected components of the comparability graph, found by merging every
+        point with the points of its minimal neighborhood in a union-find structure.
+
+        Returns:
+            list[set]: The connected components, ordered by their first point.
+        """
+        components = _DisjointSets(len(self._points))
+        for y, neighborhood in enumerate(self._neighborhood_masks()):
+            for x in _iter_bits(neighborhood):
+                components.union(x, y)
+
+        grouped = {}
+        for i, point in enumerate(self._points):
+            grouped.setdefault(components.find(i), set()).add(point)
+        return [grouped[root] for root in sorted(grouped)]
 
     def is_connected(self) -> bool:
         """
@@ -330,30 +1701,22 @@ class Topology:
 
             \\text{A space is connected if } \\nexists U, V \\in \\tau, \\quad U \\cap V = \\emptyset, \\; U \\cup V = X, \\; U \\neq \\emptyset, \\; V \\neq \\emptyset
 
+        The answer is read from :meth:`connected_components`.
+
         Returns:
             bool: True if the space is connected, False otherwise.
         """
-        # An empty space or a space with a single point is connected
-        if len(self.space) <= 1:
+        # An empty space or a space with a single component is connected
+        if self.properties().connected:
             return True
 
-        # Generate all possible partitions of the space into two non-empty sets
-        space_list = list(self.space)
-        n = len(space_list)
-
-        # Iterate over all combinations for the first set
-        for r in range(1, n // 2 + 1):
-            for subset in combinations(space_list, r):
-                U = set(subset)
-                V = self.space - U
-
-                # Check if U and V are open
-                if U in self.collection_of_subsets and V in self.collection_of_subsets:
-                    # Found a partition that separates the space, it is not connected
-                    print(f"Space separated into U={sorted(U)} and V={sorted(V)}.")
-                    return False
-
-        return True
+        # The smallest separating open set is the smallest component, the first one among those of equal size
+        if diagnostics.enabled():
+            U = min(self.connected_components(), key=len)
+            V = self.space - U
+            diagnostics.report("not_connected", f"Space separated into U={sorted(U)} and V={sorted(V)}.",
+                               separation=(U, V))
+        return False
 
     @staticmethod
     def is_compact() -> bool:
@@ -394,10 +1757,12 @@ class Topology:
         Returns:
         bool: True if the subset is open, False otherwise.
         """
-        if subset in self.collection_of_subsets:
+        mask = self._to_mask(subset)
+        if mask is not None and self._is_open_mask(mask):
             return True
         else:
-            print(f"The set {sorted(subset)} is not open.")
+            if diagnostics.enabled():
+                diagnostics.report("not_open", f"The set {sorted(subset)} is not open.", subset=subset)
             return False
 
     def is_closed(self, subset: set) -> bool:
@@ -412,11 +1777,12 @@ class Topology:
         Returns:
         bool: True if the subset is closed, False otherwise.
         """
-        complement = self.space - subset
-        if complement in self.collection_of_subsets:
+        mask = self._to_mask(subset)
+        if mask is not None and self._is_open_mask(self._full_mask ^ mask):
             return True
         else:
-            print(f"The set {sorted(subset)} is not closed.")
+            if diagnostics.enabled():
+                diagnostics.report("not_closed", f"The set {sorted(subset)} is not closed.", subset=subset)
             return False
 
     def get_complement(self, subset: set) -> set:
@@ -453,25 +1819,25 @@ class Topology:
         Returns:
             set: A dense subset if it exists, otherwise the entire space if it is the only dense subset (trivial case).
         """
-        dense_subsets = []
-
-        # In finite spaces, find the smallest subset whose closure is the entire space
-        for r in range(1, len(self.space) + 1):
-            for subset in combinations(self.space, r):
-                closure = self.get_closure(set(subset))
-                if closure == self.space:
-                    dense_subsets.append(set(subset))
-
-        # If the only dense subset is the entire space, return it with a note that it's trivial
-        if len(dense_subsets) == 1 and dense_subsets[0] == self.space:
-            print("The only dense subset is the entire space, which is a trivial case in finite topologies.")
+        if not self._points:
+            return set()
+
+        # If every point is open the only dense subset is the entire space, return it with a note that it's trivial
+        if self.properties().discrete:
+            if diagnostics.enabled():
+                diagnostics.report("trivial_dense_subset", "The only dense subset is the entire space, which is a "
+                                                           "trivial case in finite topologies.")
             return self.space
 
-        # Return the smallest non-trivial dense subset
-        if dense_subsets:
-            return min(dense_subsets, key=len)
-
-        return set()
+        # A set is dense when it meets every non empty open set, that is, every minimal non empty open set. Those
+        # are the minimal neighborhoods containing no smaller one, and they are pairwise disjoint, so a smallest
+        # dense subset takes one point, the first one, from each of them.
+        neighborhoods = self._neighborhood_masks()
+        mask = 0
+        for i, neighborhood in enumerate(neighborhoods):
+            if not neighborhood & mask and all(neighborhoods[j] == neighborhood for j in _iter_bits(neighborhood)):
+                mask |= 1 << i
+        return self._to_set(mask)
 
     @staticmethod
     def create_alexandrov_topology(space: set,
@@ -513,22 +1879,8 @@ class Topology:
         else:
             raise ValueError("relation_type must be 'function' or 'dict'.")
 
-        # Open sets are all unions of upper sets, including the empty set
-        subsets = [set()]  # Start with the empty set
-        n = len(upper_sets)
-        for i in range(1, 2 ** n):
-            union = set()
-            for j in range(n):
-                if (i >> j) & 1:
-                    union = union.union(upper_sets[j])
-            if union not in subsets:
-                subsets.append(union)
-
-        # Ensure the entire space is included
-        if set(space) not in subsets:
-            subsets.append(set(space))
-
-        return Topology(space, subsets)
+        # Open sets are all unions of upper sets: the topology generated by the upper sets
+        return Topology.generated_by(space, upper_sets)
 
     def is_separable(self) -> bool:
         """
@@ -543,17 +1895,8 @@ class Topology:
         Returns:
             bool: True if the space is separable, False otherwise.
         """
-        # In finite spaces, all spaces are separable
-        if len(self.space) <= 1:
-            return True
-
-        # In finite spaces, any non-empty finite set can be a dense basis if its closure is the entire space
-        for r in range(1, len(self.space) + 1):
-            for subset in combinations(self.space, r):
-                closure = self.get_closure(set(subset))
-                if closure == self.space:
-                    return True
-        return False
+        # In finite spaces, all spaces are separable: the whole space is a finite dense subset
+        return True
 
     def get_closure(self, subset: set) -> set:
         """
@@ -571,17 +1914,19 @@ class Topology:
         Returns:
             set: The exterior of the set.
         """
-        # Define closed sets as complements of open sets
-        closed_sets = [self.space - open_set for open_set in self.collection_of_subsets]
-
-        # Initialize closure as the entire space
-        closure = self.space.copy()
+        return self._to_set(self._closure_mask(self._to_subset_mask(subset)))
 
-        # Intersect all closed sets that contain 'subset'
-        for closed_set in closed_sets:
-            if subset.issubset(closed_set):
-                closure = closure.intersection(closed_set)
+    def _closure_mask(self, mask: int) -> int:
+        """
+        Computes the mask of the closure of the set encoded by ``mask``.
 
+        A point :math:`y` is in the closure of :math:`A` exactly when :math:`U_y` meets :math:`A`, so the closure is
+        the union of the up-sets of the points of :math:`A`.
+        """
+        up_sets = self._up_set_masks()
+        closure = 0
+        for i in _iter_bits(mask):
+            closure |= up_sets[i]
         return closure
 
     def is_hausdorff(self) -> bool:
@@ -597,22 +1942,18 @@ class Topology:
         Returns:
             bool: True if the space is Hausdorff, False otherwise.
         """
-        # Iterate over all pairs of distinct points
-        for x, y in combinations(self.space, 2):
-            separated = False
-            # Find pairs of open sets that separate x and y
-            for U in self.collection_of_subsets:
-                if x in U:
-                    for V in self.collection_of_subsets:
-                        if y in V and U.isdisjoint(V):
-                            separated = True
-                            break
-                if separated:
-                    break
-            if not separated:
-                print(f"Cannot separate points {x} and {y} with disjoint open sets.")
-                return False
-        return True
+        if self.properties().hausdorff or not diagnostics.enabled():
+            return self.properties().hausdorff
+
+        neighborhoods = self._neighborhood_masks()
+        points = self._points
+
+        # Find the first pair of points that cannot be separated. Every open set containing x contains U_x, so
+        # x and y are separated exactly when their minimal neighborhoods are disjoint.
+        i, j = next((i, j) for i, j in combinations(range(len(points)), 2) if neighborhoods[i] & neighborhoods[j])
+        diagnostics.report("not_hausdorff", f"Cannot separate points {points[i]} and {points[j]} with disjoint open "
+                                            f"sets.", points=(points[i], points[j]))
+        return False
 
     def get_interior(self, subset: set) -> set:
         """
@@ -630,10 +1971,19 @@ class Topology:
         Returns:
             set: The interior of the set.
         """
-        interior = set()
-        for open_set in self.collection_of_subsets:
-            if open_set.issubset(subset):
-                interior = interior.union(open_set)
+        return self._to_set(self._interior_mask(self._to_subset_mask(subset)))
+
+    def _interior_mask(self, mask: int) -> int:
+        """
+        Computes the mask of the interior of the set encoded by ``mask``.
+
+        A point :math:`x` is in the interior of :math:`A` exactly when :math:`U_x \\subseteq A`.
+        """
+        neighborhoods = self._neighborhood_masks()
+        interior = 0
+        for i in _iter_bits(mask):
+            if not neighborhoods[i] & ~mask:
+                interior |= 1 << i
         return interior
 
     def get_boundary(self, subset: set) -> set:
@@ -652,10 +2002,9 @@ class Topology:
         Returns:
             set: The boundary of the set.
         """
-        closure = self.get_closure(subset)
-        interior = self.get_interior(subset)
-        boundary = closure - interior
-        return boundary
+        mask = self._to_subset_mask(subset)
+        boundary = self._closure_mask(mask) & ~self._interior_mask(mask)
+        return self._to_set(boundary)
 
     def get_exterior(self, subset: set) -> set:
         """
@@ -673,9 +2022,104 @@ class Topology:
         Returns:
             set: The exterior of the set.
         """
-        complement = self.space - subset
-        exterior = self.get_interior(complement)
-        return exterior
+        complement = self._full_mask ^ self._to_subset_mask(subset)
+        exterior = self._interior_mask(complement)
+        return self._to_set(exterior)
+
+    def get_neighborhood_matrix(self):
+        """
+        Returns the boolean neighborhood matrix of the space, used by the batch queries.
+
+        Entry ``[i, j]`` is True when ``points[j]`` belongs to the minimal neighborhood of ``points[i]``. The matrix
+        is cached until the collection is modified and requires NumPy.
+
+        Returns:
+            numpy.ndarray: An (n x n) boolean array, indexed like :attr:`points`.
+        """
+        if np is None:
+            raise ImportError("The batch queries require NumPy: pip install finite-topology[numpy]")
+        if self._neighborhood_array is None:
+            n = len(self._points)
+            matrix = np.zeros((n, n), dtype=bool)
+            for i, neighborhood in enumerate(self._neighborhood_masks()):
+                matrix[i, list(_iter_bits(neighborhood))] = True
+            matrix.setflags(write=False)
+            self._neighborhood_array = matrix
+        return self._neighborhood_array
+
+    def _subset_array(self, subsets):
+        """
+        Converts a (k x n) boolean array, or a list of k subsets, into a (k x n) boolean array whose columns
+        follow :attr:`points`.
+        """
+        n = len(self._points)
+        if isinstance(subsets, np.ndarray):
+            array = np.asarray(subsets, dtype=bool)
+            if array.ndim != 2 or array.shape[1] != n:
+                raise ValueError(f"Expected an array of shape (k, {n}), got {array.shape}.")
+            return array
+        subsets = list(subsets)
+        array = np.zeros((len(subsets), n), dtype=bool)
+        for row, subset in enumerate(subsets):
+            array[row, list(_iter_bits(self._to_subset_mask(subset)))] = True
+        return array
+
+    def get_closures(self, subsets):
+        """
+        Computes the closures of many subsets at once.
+
+        A point :math:`y` is in :math:`\\overline{A}` exactly when :math:`U_y` meets :math:`A`, so with the
+        neighborhood matrix :math:`N` the closures of the rows of :math:`A` are the non-zero entries of
+        :math:`A N^T`.
+
+        Parameters:
+            subsets (numpy.ndarray or list of sets): A (k x n) boolean array with columns indexed like
+                :attr:`points`, or a list of k subsets of the space.
+
+        Returns:
+            numpy.ndarray: A (k x n) boolean array whose row ``r`` is the closure of the ``r``-th subset.
+        """
+        if np is None:
+            raise ImportError("The batch queries require NumPy: pip install finite-topology[numpy]")
+        # Float products go through BLAS; the counts are small integers, so they are exact
+        array = self._subset_array(subsets).astype(np.float32)
+        return array @ self.get_neighborhood_matrix().T.astype(np.float32) > 0
+
+    def get_interiors(self, subsets):
+        """
+        Computes the interiors of many subsets at once.
+
+        A point :math:`x` is in the interior of :math:`A` exactly when :math:`U_x \\subseteq A`, that is, when
+        :math:`U_x` does not meet the complement, so the interiors are the zero entries of
+        :math:`(X \\setminus A) N^T`.
+
+        Parameters:
+            subsets (numpy.ndarray or list of sets): A (k x n) boolean array with columns indexed like
+                :attr:`points`, or a list of k subsets of the space.
+
+        Returns:
+            numpy.ndarray: A (k x n) boolean array whose row ``r`` is the interior of the ``r``-th subset.
+        """
+        if np is None:
+            raise ImportError("The batch queries require NumPy: pip install finite-topology[numpy]")
+        complements = (~self._subset_array(subsets)).astype(np.float32)
+        return complements @ self.get_neighborhood_matrix().T.astype(np.float32) == 0
+
+    def get_boundaries(self, subsets):
+        """
+        Computes the boundaries of many subsets at once, as their closures minus their interiors.
+
+        Parameters:
+            subsets (numpy.ndarray or list of sets): A (k x n) boolean array with columns indexed like
+                :attr:`points`, or a list of k subsets of the space.
+
+        Returns:
+            numpy.ndarray: A (k x n) boolean array whose row ``r`` is the boundary of the ``r``-th subset.
+        """
+        if np is None:
+            raise ImportError("The batch queries require NumPy: pip install finite-topology[numpy]")
+        array = self._subset_array(subsets)
+        return self.get_closures(array) & ~self.get_interiors(array)
 
     def is_T0(self) -> bool:
         """
@@ -690,16 +2134,19 @@ class Topology:
         Returns:
             bool: True if the space is T0, False otherwise.
         """
-        # Iterate over all pairs of distinct points
-        for x, y in combinations(self.space, 2):
-            # Check if at least one can be separated from the other
-            x_separates = any(x in U and y not in U for U in self.collection_of_subsets)
-            y_separates = any(y in U and x not in U for U in self.collection_of_subsets)
-
-            if not (x_separates or y_separates):
-                print(f"Cannot separate {x} and {y} in a T0 space.")
+        if self.properties().T0 or not diagnostics.enabled():
+            return self.properties().T0
+
+        points = self._points
+
+        # Two points can be separated by an open set exactly when their minimal neighborhoods differ
+        seen = {}
+        for i, neighborhood in enumerate(self._neighborhood_masks()):
+            j = seen.setdefault(neighborhood, i)
+            if j != i:
+                diagnostics.report("not_T0", f"Cannot separate {points[j]} and {points[i]} in a T0 space.",
+                                   points=(points[j], points[i]))
                 return False
-        return True
 
     def is_T1(self) -> bool:
         """
@@ -719,15 +2166,14 @@ class Topology:
         Returns:
             bool: True if the space is T1, False otherwise.
         """
-        # Iterate over all points in the space
-        for point in self.space:
-            # Calculate the complement of the current point
-            complement = self.space - {point}
+        if self.properties().T1 or not diagnostics.enabled():
+            return self.properties().T1
 
-            # Check if the complement is an open set
-            if complement not in self.collection_of_subsets:
-                print(f"Point {point} is not closed, complement {complement} is not open.")
-                return False
+        up_sets = self._up_set_masks()
 
-        # If all points are closed (i.e., their complements are open), the space is T1
-        return True
+        # Find the first point that is not closed: its closure (its up-set) is not the point itself
+        i = next(i for i in range(len(self._points)) if up_sets[i] != 1 << i)
+        point = self._points[i]
+        complement = self._to_set(self._full_mask ^ (1 << i))
+        diagnostics.report("not_T1", f"Point {point} is not closed, complement {complement} is not open.", point=point)
+        return False
@@ -27,6 +27,9 @@ setup(
     install_requires=[
         # Add any dependencies here, if needed
     ],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     include_package_data=True,
     keywords='topology, mathematics, finite sets, discrete topology',
     project_urls={